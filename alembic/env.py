@@ -26,6 +26,15 @@ if config.config_file_name is not None:
 # from myapp import mymodel
 target_metadata = Base.metadata
 
+# tables without orm model, created by migrations only (ignored by autogenerate)
+unmanaged_table_names = {"data_version"}
+
+
+def include_name(name: str | None, type_: str, parent_names: dict) -> bool:
+    """Exclude the unmanaged tables from autogenerate."""
+
+    return not (type_ == "table" and name in unmanaged_table_names)
+
 
 # other values from the envs, defined by the needs of env.py,
 # can be acquired:
@@ -63,6 +72,7 @@ def run_migrations_offline() -> None:
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_name=include_name,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -75,6 +85,7 @@ def do_run_migrations(connection: Connection) -> None:
     context.configure(
         connection=connection,
         target_metadata=target_metadata,
+        include_name=include_name,
     )
 
     with context.begin_transaction():
@@ -0,0 +1,81 @@
+"""add_data_version_table
+
+Revision ID: b7e4c19d2f60
+Revises: 90e853641282
+Create Date: 2026-10-18 10:12:31.482113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e4c19d2f60'
+down_revision: Union[str, None] = '90e853641282'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# all tables, which changes will bump the data version
+data_table_names = (
+    'moneyboxes',
+    'moneybox_name_histories',
+    'transactions',
+    'app_settings',
+    'action_logs',
+    'users',
+)
+
+# next version: at least +1, but never below the current time in microseconds,
+# so the version keeps increasing after a database reset or a restored dump
+next_version_sql = (
+    'GREATEST(version + 1, (extract(epoch FROM clock_timestamp()) * 1000000)::bigint)'
+)
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+    CREATE TABLE data_version (
+        id smallint PRIMARY KEY CHECK (id = 1),
+        version bigint NOT NULL
+    );
+    """
+    )
+    op.execute(
+        "INSERT INTO data_version (id, version) "
+        "VALUES (1, (extract(epoch FROM clock_timestamp()) * 1000000)::bigint)"
+    )
+
+    op.execute(
+        f"""
+    CREATE FUNCTION bump_data_version() RETURNS void LANGUAGE sql AS $$
+        UPDATE data_version SET version = {next_version_sql} WHERE id = 1;
+    $$;
+    """
+    )
+    op.execute(
+        """
+    CREATE FUNCTION bump_data_version_trigger() RETURNS trigger LANGUAGE plpgsql AS $$
+    BEGIN
+        PERFORM bump_data_version();
+        RETURN NULL;
+    END;
+    $$;
+    """
+    )
+
+    for table_name in data_table_names:
+        op.execute(
+            f"CREATE TRIGGER bump_data_version AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE "
+            f"ON {table_name} FOR EACH STATEMENT EXECUTE FUNCTION bump_data_version_trigger()"
+        )
+
+
+def downgrade() -> None:
+    for table_name in data_table_names:
+        op.execute(f"DROP TRIGGER IF EXISTS bump_data_version ON {table_name}")
+
+    op.execute("DROP FUNCTION IF EXISTS bump_data_version_trigger()")
+    op.execute("DROP FUNCTION IF EXISTS bump_data_version()")
+    op.execute("DROP TABLE IF EXISTS data_version")
@@ -0,0 +1 @@
+"""Benchmarks of the savings manager are located here."""
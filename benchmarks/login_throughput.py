@@ -0,0 +1,124 @@
+"""Login throughput benchmark.
+
+Fires concurrent logins against `POST /api/app/login` while a probe requests
+`GET /api/app/metadata` every few milliseconds. With bcrypt running on the event loop,
+the probe latency grows with each login in flight; with the bounded bcrypt thread pool
+the probe keeps responding.
+
+Requirements: a migrated database (`alembic upgrade head`), configured by the env file
+of the given environment.
+
+Usage::
+
+    ENVIRONMENT=test python -m benchmarks.login_throughput --logins 40
+    ENVIRONMENT=test python -m benchmarks.login_throughput --logins 40 --inline-bcrypt
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from concurrent.futures import Executor, Future
+from typing import Any, Callable
+
+from httpx import ASGITransport, AsyncClient
+
+from src.custom_types import EndpointRouteType
+from src.db.db_manager import DBManager
+from src.db.exceptions import UserNameAlreadyExistError
+from src.main import app, register_router
+from src.singleton import limiter
+from src.utils import get_app_env_variables
+
+USER_NAME: str = "benchmark_user"
+USER_PASSWORD: str = "benchmark-password"
+
+
+class InlineExecutor(Executor):
+    """Executor, which runs the function directly, to simulate bcrypt on the event loop."""
+
+    def submit(self, fn: Callable, /, *args: Any, **kwargs: Any) -> Future:
+        future: Future = Future()
+        future.set_result(fn(*args, **kwargs))
+        return future
+
+
+async def probe(client: AsyncClient, stop: asyncio.Event, latencies: list[float]) -> None:
+    """Request the metadata endpoint until stop is set and collect the latencies."""
+
+    while not stop.is_set():
+        started_at: float = time.perf_counter()
+        await client.get(f"/{EndpointRouteType.APP_ROOT}/{EndpointRouteType.APP}/metadata")
+        latencies.append(time.perf_counter() - started_at)
+        await asyncio.sleep(0.005)
+
+
+async def login(client: AsyncClient) -> None:
+    """Log in the benchmark user."""
+
+    response = await client.post(
+        f"/{EndpointRouteType.APP_ROOT}/{EndpointRouteType.APP}/login",
+        json={"userName": USER_NAME, "userPassword": USER_PASSWORD},
+    )
+    response.raise_for_status()
+
+
+async def main(logins: int, inline_bcrypt: bool) -> None:
+    """Run the benchmark and print the results."""
+
+    _, app_env_variables = get_app_env_variables()
+    db_manager: DBManager = DBManager(db_settings=app_env_variables)
+
+    if inline_bcrypt:
+        db_manager.password_hasher.executor = InlineExecutor()  # type: ignore
+
+    try:
+        await db_manager.add_user(user_name=USER_NAME, user_password=USER_PASSWORD)
+    except UserNameAlreadyExistError:
+        pass
+
+    register_router(fastapi_app=app)
+    app.state.db_manager = db_manager
+    app.state.limiter = limiter
+
+    latencies: list[float] = []
+    stop: asyncio.Event = asyncio.Event()
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as client:
+        probe_task: asyncio.Task = asyncio.create_task(probe(client, stop, latencies))
+
+        started_at: float = time.perf_counter()
+        await asyncio.gather(*(login(client) for _ in range(logins)))
+        duration: float = time.perf_counter() - started_at
+
+        stop.set()
+        await probe_task
+
+    await db_manager.async_engine.dispose()
+
+    latencies_ms: list[float] = sorted(latency * 1000 for latency in latencies)
+    print(
+        f"bcrypt: {'event loop' if inline_bcrypt else 'thread pool'} "
+        f"(rounds={app_env_variables.bcrypt_rounds}, "
+        f"workers={app_env_variables.bcrypt_max_workers})"
+    )
+    print(f"logins: {logins} in {duration:.2f} s -> {logins / duration:.1f} logins/s")
+    print(
+        f"probe GET /metadata: {len(latencies_ms)} requests, "
+        f"p50={statistics.median(latencies_ms):.1f} ms, "
+        f"p95={latencies_ms[int(len(latencies_ms) * 0.95)]:.1f} ms, "
+        f"max={latencies_ms[-1]:.1f} ms"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--logins", type=int, default=20, help="number of concurrent logins")
+    parser.add_argument(
+        "--inline-bcrypt",
+        action="store_true",
+        help="run bcrypt on the event loop (behaviour before the thread pool)",
+    )
+    arguments = parser.parse_args()
+
+    asyncio.run(main(logins=arguments.logins, inline_bcrypt=arguments.inline_bcrypt))
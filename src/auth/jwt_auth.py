@@ -1,6 +1,9 @@
 """The JWT classes and functions are located here."""
 
+import hashlib
+import time
 from asyncio import Lock
+from collections import OrderedDict
 from typing import Annotated, Any
 
 from async_fastapi_jwt_auth.auth_jwt import AuthJWT
@@ -19,6 +22,9 @@ LOGIN_REQUEST_PATH: str = f"/{EndpointRouteType.APP_ROOT}/{EndpointRouteType.APP
 
 _APP_MAJOR_VERSION = 4
 
+JWT_CLAIMS_CACHE_SIZE: int = 1024
+"""The max number of cached verified JWT claims."""
+
 
 class JWTSettings(BaseModel):
     """The JWT settings model for"""
@@ -81,6 +87,124 @@ class JWTSettings(BaseModel):
     from CSRF Attacks, default is None."""
 
 
+class JWTClaimsCache:
+    """LRU cache of verified JWT claims, keyed by the SHA-256 hash of the encoded token.
+
+    Entries expire with the `exp` claim of their token, so an expired token is
+    always verified (and rejected) by the JWT library again.
+    """
+
+    def __init__(self, max_size: int = JWT_CLAIMS_CACHE_SIZE) -> None:
+        """Initialize the JWTClaimsCache instance.
+
+        :param max_size: The max number of cached claims, 0 disables the cache,
+            defaults to JWT_CLAIMS_CACHE_SIZE.
+        :type max_size: :class:`int`
+        """
+
+        self.max_size: int = max_size
+        self._claims: OrderedDict[str, tuple[dict[str, Any], float]] = OrderedDict()
+
+    @staticmethod
+    def get_key(encoded_token: str, issuer: str | None) -> str:
+        """Get the cache key of the encoded token.
+
+        :param encoded_token: The encoded JWT.
+        :type encoded_token: :class:`str`
+        :param issuer: The expected issuer of the JWT.
+        :type issuer: :class:`str` | :class:`None`
+        :return: The cache key.
+        :rtype: :class:`str`
+        """
+
+        return hashlib.sha256(f"{issuer}:{encoded_token}".encode()).hexdigest()
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Get the cached claims of the given key.
+
+        :param key: The cache key.
+        :type key: :class:`str`
+        :return: The claims, None if not cached or expired.
+        :rtype: :class:`dict[str, Any]` | :class:`None`
+        """
+
+        cached: tuple[dict[str, Any], float] | None = self._claims.get(key)
+
+        if cached is None:
+            return None
+
+        claims, expires_at = cached
+
+        if expires_at <= time.time():
+            del self._claims[key]
+            return None
+
+        self._claims.move_to_end(key)
+        return dict(claims)
+
+    def set(self, key: str, claims: dict[str, Any]) -> None:
+        """Cache the claims until the expiry of their token. Claims without
+        `exp` are not cached.
+
+        :param key: The cache key.
+        :type key: :class:`str`
+        :param claims: The verified claims.
+        :type claims: :class:`dict[str, Any]`
+        """
+
+        if self.max_size < 1 or not isinstance(claims.get("exp"), (int, float)):
+            return
+
+        self._claims[key] = (dict(claims), float(claims["exp"]))
+        self._claims.move_to_end(key)
+
+        while len(self._claims) > self.max_size:
+            self._claims.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached claims."""
+
+        self._claims.clear()
+
+    def __len__(self) -> int:
+        return len(self._claims)
+
+
+class CachedAuthJWT(AuthJWT):
+    """AuthJWT, which verifies each token only once until it expires.
+
+    `jwt_required()` and `get_raw_jwt()` decode and verify the same token several
+    times per request. All of them end in `_verified_token`, so caching its result
+    removes the repeated signature checks, while all other checks (token type, CSRF
+    double submit, denylist) still run on every request.
+    """
+
+    _claims_cache: JWTClaimsCache = JWTClaimsCache()
+
+    async def _verified_token(
+        self, encoded_token: str, issuer: str | None = None
+    ) -> dict[str, Any]:
+        """Get the verified claims of the encoded token from the cache or
+        verify the token.
+
+        :param encoded_token: The encoded JWT.
+        :type encoded_token: :class:`str`
+        :param issuer: The expected issuer of the JWT.
+        :type issuer: :class:`str` | :class:`None`
+        :return: The claims of the JWT.
+        :rtype: :class:`dict[str, Any]`
+        """
+
+        key: str = JWTClaimsCache.get_key(encoded_token=encoded_token, issuer=issuer)
+        claims: dict[str, Any] | None = CachedAuthJWT._claims_cache.get(key)
+
+        if claims is None:
+            claims = await super()._verified_token(encoded_token, issuer)
+            CachedAuthJWT._claims_cache.set(key=key, claims=claims)
+
+        return claims
+
+
 class UserAuthJWTBearer(SecurityHTTPBearer):  # pylint: disable=too-few-public-methods
     """Custom implementation of class `async_fastapi_jwt_auth.auth_jwt.AuthJWTBearer`.
 
@@ -98,6 +222,11 @@ class UserAuthJWTBearer(SecurityHTTPBearer):  # pylint: disable=too-few-public-m
 
     def __init__(self, access_limited_to_roles: list[UserRoleType] | None = None):
         self.access_limited_to_roles: list[UserRoleType] | None = access_limited_to_roles
+        self._allowed_role_names: frozenset[str] | None = (
+            frozenset(str(role) for role in access_limited_to_roles)
+            if access_limited_to_roles is not None
+            else None
+        )
         super().__init__()
 
     async def __call__(
@@ -113,17 +242,17 @@ class UserAuthJWTBearer(SecurityHTTPBearer):  # pylint: disable=too-few-public-m
                     UserAuthJWTBearer._load_jwt_config()
                     UserAuthJWTBearer._config_loaded = True
 
-        auth_jwt = AuthJWT(req=req, res=res)
+        auth_jwt = CachedAuthJWT(req=req, res=res)
 
         if APP_MAJOR_VERSION >= 3:
             if req.scope["path"] != LOGIN_REQUEST_PATH:
                 await auth_jwt.jwt_required()
 
-                if self.access_limited_to_roles is not None:
+                if self._allowed_role_names is not None:
+                    # claims of the verified token are cached, no second decoding
                     jwt_dict: dict[str, Any] = await auth_jwt.get_raw_jwt()
-                    user_role: UserRoleType = UserRoleType(jwt_dict["role"])
 
-                    if user_role not in self.access_limited_to_roles:
+                    if jwt_dict.get("role") not in self._allowed_role_names:
                         raise MissingRoleError(
                             status_code=403, message="Not authorized. Missing role."
                         )
@@ -137,6 +266,9 @@ class UserAuthJWTBearer(SecurityHTTPBearer):  # pylint: disable=too-few-public-m
         print("Load AuthJWT Configuration...", flush=True)
         AuthJWT.load_config(UserAuthJWTBearer._get_jwt_config)  # type: ignore
 
+        # claims verified with the previous config (e.g. secret key) are invalid now
+        CachedAuthJWT._claims_cache.clear()  # pylint: disable=protected-access
+
     @staticmethod
     def _get_jwt_config() -> JWTSettings:
         """Retrieve the JWT configuration settings.
@@ -0,0 +1,189 @@
+"""The login throttle is located here."""
+
+import math
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+
+@dataclass
+class TokenBucket:
+    """A token bucket, which refills continuously up to its capacity."""
+
+    tokens: float
+    """The current number of tokens."""
+
+    updated_at: float
+    """The monotonic time of the last refill."""
+
+
+class LoginThrottle:
+    """The LoginThrottle limits failed logins per user name and per client IP
+    with token buckets, before any password hash is verified.
+
+    Each failed login takes one token of the user name bucket and one token of the
+    IP bucket. If one of both buckets is empty, further logins are rejected until a
+    token was refilled. A successful login refills the bucket of the user name, so
+    normal users are never locked out by their own typos.
+
+    Full buckets are dropped, so only clients with recent failed logins are held in
+    memory, at most `max_entries` buckets (least recently used are evicted first).
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments, too-many-positional-arguments
+        self,
+        user_name_capacity: int = 5,
+        user_name_refill_interval: float = 12,
+        ip_capacity: int = 20,
+        ip_refill_interval: float = 3,
+        max_entries: int = 10_000,
+    ) -> None:
+        """Initialize the LoginThrottle instance.
+
+        :param user_name_capacity: The max number of failed logins in a row per
+            user name, defaults to 5.
+        :type user_name_capacity: :class:`int`
+        :param user_name_refill_interval: Seconds until one failed login per user name
+            is forgiven, defaults to 12.
+        :type user_name_refill_interval: :class:`float`
+        :param ip_capacity: The max number of failed logins in a row per client IP,
+            defaults to 20.
+        :type ip_capacity: :class:`int`
+        :param ip_refill_interval: Seconds until one failed login per client IP
+            is forgiven, defaults to 3.
+        :type ip_refill_interval: :class:`float`
+        :param max_entries: The max number of held buckets, defaults to 10_000.
+        :type max_entries: :class:`int`
+        """
+
+        if user_name_capacity < 1 or ip_capacity < 1:
+            raise ValueError(
+                f"Capacities must be >= 1, got {user_name_capacity=}, {ip_capacity=}"
+            )
+
+        if user_name_refill_interval <= 0 or ip_refill_interval <= 0:
+            raise ValueError(
+                "Refill intervals must be > 0, "
+                f"got {user_name_refill_interval=}, {ip_refill_interval=}"
+            )
+
+        self.user_name_capacity: int = user_name_capacity
+        self.user_name_refill_interval: float = user_name_refill_interval
+        self.ip_capacity: int = ip_capacity
+        self.ip_refill_interval: float = ip_refill_interval
+        self.max_entries: int = max_entries
+        self._buckets: OrderedDict[str, TokenBucket] = OrderedDict()
+
+    def retry_after(self, user_name: str, ip: str | None) -> int:
+        """Get the seconds until the next login for the given user name and client IP
+        is allowed.
+
+        :param user_name: The user name of the login.
+        :type user_name: :class:`str`
+        :param ip: The client IP of the login.
+        :type ip: :class:`str` | :class:`None`
+        :return: The seconds to wait, 0 if the login is allowed.
+        :rtype: :class:`int`
+        """
+
+        now: float = time.monotonic()
+        retry_after: float = 0
+
+        for key, _, refill_interval in self._bucket_configs(user_name=user_name, ip=ip):
+            bucket: TokenBucket | None = self._refill(key=key, now=now)
+
+            if bucket is not None and bucket.tokens < 1:
+                retry_after = max(retry_after, (1 - bucket.tokens) * refill_interval)
+
+        return math.ceil(retry_after)
+
+    def record_failure(self, user_name: str, ip: str | None) -> None:
+        """Take one token from the user name and the client IP bucket.
+
+        :param user_name: The user name of the failed login.
+        :type user_name: :class:`str`
+        :param ip: The client IP of the failed login.
+        :type ip: :class:`str` | :class:`None`
+        """
+
+        now: float = time.monotonic()
+
+        for key, capacity, _ in self._bucket_configs(user_name=user_name, ip=ip):
+            bucket: TokenBucket | None = self._refill(key=key, now=now)
+
+            if bucket is None:
+                bucket = TokenBucket(tokens=capacity, updated_at=now)
+                self._buckets[key] = bucket
+
+            bucket.tokens = max(bucket.tokens - 1, 0)
+
+        while len(self._buckets) > self.max_entries:
+            self._buckets.popitem(last=False)
+
+    def record_success(self, user_name: str) -> None:
+        """Refill the user name bucket after a successful login.
+
+        :param user_name: The user name of the successful login.
+        :type user_name: :class:`str`
+        """
+
+        self._buckets.pop(f"user:{user_name}", None)
+
+    def reset(self) -> None:
+        """Drop all buckets."""
+
+        self._buckets.clear()
+
+    def _bucket_configs(
+        self, user_name: str, ip: str | None
+    ) -> list[tuple[str, int, float]]:
+        """Get the bucket keys with capacity and refill interval for a login.
+
+        :param user_name: The user name of the login.
+        :type user_name: :class:`str`
+        :param ip: The client IP of the login.
+        :type ip: :class:`str` | :class:`None`
+        :return: The bucket key, the capacity and refill interval of each bucket.
+        :rtype: :class:`list[tuple[str, int, float]]`
+        """
+
+        bucket_configs: list[tuple[str, int, float]] = [
+            (f"user:{user_name}", self.user_name_capacity, self.user_name_refill_interval),
+        ]
+
+        if ip is not None:
+            bucket_configs.append((f"ip:{ip}", self.ip_capacity, self.ip_refill_interval))
+
+        return bucket_configs
+
+    def _refill(self, key: str, now: float) -> TokenBucket | None:
+        """Refill the bucket with the given key by the elapsed time. Full buckets
+        will be dropped.
+
+        :param key: The bucket key.
+        :type key: :class:`str`
+        :param now: The current monotonic time.
+        :type now: :class:`float`
+        :return: The refilled bucket, None if there is no (longer a) bucket.
+        :rtype: :class:`TokenBucket` | :class:`None`
+        """
+
+        bucket: TokenBucket | None = self._buckets.get(key)
+
+        if bucket is None:
+            return None
+
+        capacity, refill_interval = (
+            (self.user_name_capacity, self.user_name_refill_interval)
+            if key.startswith("user:")
+            else (self.ip_capacity, self.ip_refill_interval)
+        )
+        bucket.tokens += (now - bucket.updated_at) / refill_interval
+        bucket.updated_at = now
+
+        if bucket.tokens >= capacity:
+            del self._buckets[key]
+            return None
+
+        self._buckets.move_to_end(key)
+        return bucket
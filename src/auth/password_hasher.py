@@ -0,0 +1,92 @@
+"""The bcrypt password hasher is located here."""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import bcrypt
+
+
+class PasswordHasher:
+    """The PasswordHasher runs bcrypt hashing and verification in a dedicated,
+    bounded thread pool, so the event loop is never blocked by the (intentionally)
+    slow bcrypt rounds.
+
+    bcrypt releases the GIL while hashing, so up to `max_workers` hashes run in
+    parallel. Further calls wait in the pool queue.
+    """
+
+    def __init__(self, rounds: int = 12, max_workers: int = 2) -> None:
+        """Initialize the PasswordHasher instance.
+
+        :param rounds: The bcrypt cost factor (log2 of the rounds) for new hashes,
+            defaults to 12.
+        :type rounds: :class:`int`
+        :param max_workers: The max number of parallel hash operations, defaults to 2.
+        :type max_workers: :class:`int`
+        """
+
+        self.rounds: int = rounds
+        self.max_workers: int = max_workers
+        self.executor: ThreadPoolExecutor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="bcrypt",
+        )
+
+    async def hash(self, password: str | bytes) -> str:
+        """Get hashed password.
+
+        :param password: The password.
+        :type password: :class:`str` | :class:`bytes`
+        :return: The hashed password.
+        :rtype: :class:`str`
+        """
+
+        if isinstance(password, str):
+            password = password.encode("utf-8")
+
+        hashed_password: bytes = await asyncio.get_running_loop().run_in_executor(
+            self.executor,
+            self._hashpw,
+            password,
+        )
+        return hashed_password.decode()
+
+    async def verify(self, plain_password: str | bytes, hashed_password: str | bytes) -> bool:
+        """Verify the plain_password matches the hashed password.
+
+        :param plain_password: The plain password.
+        :type plain_password: :class:`str` | :class:`bytes`
+        :param hashed_password: The hashed password.
+        :type hashed_password: :class:`str` | :class:`bytes`
+        :return: True, if the hashed password matches the plain_password.
+        :rtype: :class:`bool`
+        """
+
+        if isinstance(plain_password, str):
+            plain_password = plain_password.encode("utf-8")
+
+        if isinstance(hashed_password, str):
+            hashed_password = hashed_password.encode("utf-8")
+
+        return await asyncio.get_running_loop().run_in_executor(
+            self.executor,
+            bcrypt.checkpw,
+            plain_password,
+            hashed_password,
+        )
+
+    def _hashpw(self, password: bytes) -> bytes:
+        """Hash the password with a new salt of the configured cost factor.
+
+        :param password: The password.
+        :type password: :class:`bytes`
+        :return: The hashed password.
+        :rtype: :class:`bytes`
+        """
+
+        return bcrypt.hashpw(password, bcrypt.gensalt(self.rounds))
+
+    def close(self) -> None:
+        """Shut down the thread pool, running hash operations will be finished."""
+
+        self.executor.shutdown(wait=False, cancel_futures=True)
@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from enum import StrEnum
 from typing import Self
 
-from pydantic import ConfigDict, SecretStr, model_validator
+from pydantic import ConfigDict, Field, SecretStr, model_validator
 from pydantic_settings import BaseSettings
 
 
@@ -102,6 +102,21 @@ class AppEnvVariables(BaseSettings):
     smtp_password: SecretStr | None = None
     """The user password."""
 
+    smtp_max_connections: int = Field(default=3, ge=1)
+    """The max number of parallel (reused) smtp sessions."""
+
+    # PASSWORD HASHING
+    bcrypt_rounds: int = Field(default=12, ge=4, le=31)
+    """The bcrypt cost factor (log2 of the rounds) for new password hashes."""
+
+    bcrypt_max_workers: int = Field(default=2, ge=1)
+    """The max number of parallel bcrypt hash operations (thread pool size)."""
+
+    # RATE LIMITS
+    rate_limit_storage_uri: str = "memory://"
+    """The storage of the endpoint rate limits, `memory://` (per process) or
+    `sqlite:///<path>` (shared by all worker processes)."""
+
     # AUTH JWT DATA
     authjwt_secret_key: SecretStr
     """The JWT secret key."""
@@ -247,6 +262,32 @@ class MoneyboxSavingsMonthData:
     month: int
 
 
+class CircuitBreakerStateType(StrEnum):
+    """The states of a circuit breaker."""
+
+    CLOSED = "closed"
+    """Requests pass, the service is healthy."""
+
+    OPEN = "open"
+    """Requests are short-circuited, the service is unhealthy."""
+
+    HALF_OPEN = "half_open"
+    """The recovery timeout expired, one trial request may pass."""
+
+
+class TaskOutcomeType(StrEnum):
+    """The outcome of a background task execution."""
+
+    RUNNING = "running"
+    """The task is currently running."""
+
+    SUCCESS = "success"
+    """The task finished successfully."""
+
+    FAILURE = "failure"
+    """The task raised an exception."""
+
+
 class DBViolationErrorType(StrEnum):
     """The checkconstraint names of all models defined as enum."""
 
@@ -19,7 +19,9 @@ from pydantic import (
 from pydantic_extra_types.semantic_version import SemanticVersion
 
 from src.custom_types import (
+    CircuitBreakerStateType,
     OverflowMoneyboxAutomatedSavingsModeType,
+    TaskOutcomeType,
     TransactionTrigger,
     TransactionType,
     UserRoleType,
@@ -1123,3 +1125,266 @@ class MoneyboxForecastListResponse(BaseModel):
         """The count of results."""
 
         return len(self.moneybox_forecasts)
+
+
+class EmailSenderStatusResponse(BaseModel):
+    """The email sender status response model, includes the state and counters of
+    the smtp circuit breaker."""
+
+    state: Annotated[
+        CircuitBreakerStateType,
+        Field(description="The current state of the smtp circuit breaker."),
+    ]
+    """The current state of the smtp circuit breaker."""
+
+    failure_threshold: Annotated[
+        int,
+        Field(
+            validation_alias="failure_threshold",
+            description="The number of consecutive failures, which opens the breaker.",
+        ),
+    ]
+    """The number of consecutive failures, which opens the breaker."""
+
+    recovery_timeout: Annotated[
+        float,
+        Field(
+            validation_alias="recovery_timeout",
+            description="Seconds until an open breaker lets a trial request pass.",
+        ),
+    ]
+    """Seconds until an open breaker lets a trial request pass."""
+
+    consecutive_failures: Annotated[
+        int,
+        Field(
+            validation_alias="consecutive_failures",
+            description="The number of consecutive failed sends.",
+        ),
+    ]
+    """The number of consecutive failed sends."""
+
+    success_count: Annotated[
+        int,
+        Field(validation_alias="success_count", description="The number of sent emails."),
+    ]
+    """The number of sent emails."""
+
+    failure_count: Annotated[
+        int,
+        Field(validation_alias="failure_count", description="The number of failed sends."),
+    ]
+    """The number of failed sends."""
+
+    short_circuit_count: Annotated[
+        int,
+        Field(
+            validation_alias="short_circuit_count",
+            description="The number of sends rejected by the open breaker.",
+        ),
+    ]
+    """The number of sends rejected by the open breaker."""
+
+    opened_count: Annotated[
+        int,
+        Field(
+            validation_alias="opened_count",
+            description="The number of times the breaker opened.",
+        ),
+    ]
+    """The number of times the breaker opened."""
+
+    opened_at: Annotated[
+        AwareDatetime | None,
+        Field(
+            validation_alias="opened_at",
+            description="The datetime, the breaker opened, None if closed.",
+        ),
+    ]
+    """The datetime, the breaker opened, None if closed."""
+
+    last_failure_at: Annotated[
+        AwareDatetime | None,
+        Field(
+            validation_alias="last_failure_at",
+            description="The datetime of the last failed send.",
+        ),
+    ]
+    """The datetime of the last failed send."""
+
+    model_config = ConfigDict(
+        extra="forbid",
+        frozen=True,
+        strict=True,
+        alias_generator=to_camel_cleaned_suffix,
+        json_schema_extra={
+            "examples": [
+                {
+                    "state": CircuitBreakerStateType.OPEN,
+                    "failureThreshold": 3,
+                    "recoveryTimeout": 300,
+                    "consecutiveFailures": 3,
+                    "successCount": 12,
+                    "failureCount": 3,
+                    "shortCircuitCount": 2,
+                    "openedCount": 1,
+                    "openedAt": "2024-08-11 13:57:17.941840Z",
+                    "lastFailureAt": "2024-08-11 13:57:17.941840Z",
+                },
+            ],
+        },
+    )
+    """The config of the model."""
+
+
+class TaskRunStatsResponse(BaseModel):
+    """The execution stats response model of a background task."""
+
+    task_name: Annotated[
+        str,
+        Field(validation_alias="task_name", description="The name of the task."),
+    ]
+    """The name of the task."""
+
+    run_count: Annotated[
+        int,
+        Field(validation_alias="run_count", description="The number of executions."),
+    ]
+    """The number of executions."""
+
+    success_count: Annotated[
+        int,
+        Field(
+            validation_alias="success_count",
+            description="The number of successful executions.",
+        ),
+    ]
+    """The number of successful executions."""
+
+    failure_count: Annotated[
+        int,
+        Field(validation_alias="failure_count", description="The number of failed executions."),
+    ]
+    """The number of failed executions."""
+
+    last_outcome: Annotated[
+        TaskOutcomeType | None,
+        Field(
+            validation_alias="last_outcome",
+            description="The outcome of the last execution.",
+        ),
+    ]
+    """The outcome of the last execution."""
+
+    last_started_at: Annotated[
+        AwareDatetime | None,
+        Field(
+            validation_alias="last_started_at",
+            description="The start datetime of the last execution.",
+        ),
+    ]
+    """The start datetime of the last execution."""
+
+    last_finished_at: Annotated[
+        AwareDatetime | None,
+        Field(
+            validation_alias="last_finished_at",
+            description="The end datetime of the last execution.",
+        ),
+    ]
+    """The end datetime of the last execution."""
+
+    last_duration: Annotated[
+        float | None,
+        Field(
+            validation_alias="last_duration",
+            description="The duration of the last execution in seconds.",
+        ),
+    ]
+    """The duration of the last execution in seconds."""
+
+    last_rows_touched: Annotated[
+        int | None,
+        Field(
+            validation_alias="last_rows_touched",
+            description="The number of inserted/updated/deleted rows of the last execution.",
+        ),
+    ]
+    """The number of inserted/updated/deleted rows of the last execution."""
+
+    total_rows_touched: Annotated[
+        int,
+        Field(
+            validation_alias="total_rows_touched",
+            description="The number of inserted/updated/deleted rows of all executions.",
+        ),
+    ]
+    """The number of inserted/updated/deleted rows of all executions."""
+
+    last_exception: Annotated[
+        str | None,
+        Field(
+            validation_alias="last_exception",
+            description="The exception of the last failed execution.",
+        ),
+    ]
+    """The exception of the last failed execution."""
+
+    next_run_at: Annotated[
+        AwareDatetime | None,
+        Field(
+            validation_alias="next_run_at",
+            description="The datetime of the next scheduled execution.",
+        ),
+    ]
+    """The datetime of the next scheduled execution."""
+
+    model_config = ConfigDict(
+        extra="forbid",
+        frozen=True,
+        strict=True,
+        alias_generator=to_camel_cleaned_suffix,
+        json_schema_extra={
+            "examples": [
+                {
+                    "taskName": "TASK_EMAIL_SENDING",
+                    "runCount": 3,
+                    "successCount": 2,
+                    "failureCount": 1,
+                    "lastOutcome": TaskOutcomeType.SUCCESS,
+                    "lastStartedAt": "2024-08-11 13:57:17.941840Z",
+                    "lastFinishedAt": "2024-08-11 13:57:18.312860Z",
+                    "lastDuration": 0.37102,
+                    "lastRowsTouched": 2,
+                    "totalRowsTouched": 5,
+                    "lastException": "SMTPServerDisconnected('Server disconnected.')",
+                    "nextRunAt": "2024-08-11 14:57:18.312860Z",
+                },
+            ],
+        },
+    )
+    """The config of the model."""
+
+
+class TasksResponse(BaseModel):
+    """The background tasks response model."""
+
+    tasks: Annotated[
+        list[TaskRunStatsResponse],
+        Field(description="The execution stats of all tracked background tasks."),
+    ]
+    """The execution stats of all tracked background tasks."""
+
+    model_config = ConfigDict(
+        extra="forbid",
+        frozen=True,
+        strict=True,
+    )
+    """The config of the model."""
+
+    @computed_field  # type: ignore
+    @property
+    def total(self) -> int:
+        """The count of results."""
+
+        return len(self.tasks)
@@ -5,11 +5,12 @@ import asyncio
 import io
 import subprocess
 import tempfile
+import time
+from collections import OrderedDict
 from datetime import datetime, timezone
 from functools import cached_property
 from typing import Any, Sequence, cast
 
-import bcrypt
 from fastapi.encoders import jsonable_encoder
 from sqlalchemy import (
     Result,
@@ -18,6 +19,7 @@ from sqlalchemy import (
     desc,
     insert,
     select,
+    text,
     update,
 )
 from sqlalchemy.ext.asyncio import (
@@ -29,6 +31,7 @@ from sqlalchemy.ext.asyncio import (
 from sqlalchemy.orm import joinedload
 
 from alembic.config import CommandLine
+from src.auth.password_hasher import PasswordHasher
 from src.custom_types import (
     ActionType,
     AppEnvVariables,
@@ -75,6 +78,12 @@ from src.db.models import (
 )
 from src.utils import get_database_url
 
+UNKNOWN_USER_NAMES_CACHE_SIZE: int = 1024
+"""The max number of cached unknown user names."""
+
+UNKNOWN_USER_NAMES_CACHE_TTL: float = 300
+"""Seconds an unknown user name stays cached."""
+
 
 class DBManager:  # pylint: disable=too-many-public-methods
     """All db manager logic is located here."""
@@ -103,6 +112,14 @@ class DBManager:  # pylint: disable=too-many-public-methods
             bind=self.async_engine,
             expire_on_commit=False,
         )
+        self.password_hasher: PasswordHasher = PasswordHasher(
+            rounds=db_settings.bcrypt_rounds,
+            max_workers=db_settings.bcrypt_max_workers,
+        )
+        self._unknown_user_names: OrderedDict[str, float] = OrderedDict()
+        """Negative cache of user names without active user, mapped to their expiry
+        (monotonic time). Spares the database lookup for repeated logins with
+        unknown user names."""
 
     @cached_property
     def db_connection_string(self) -> str:
@@ -1288,6 +1305,8 @@ class DBManager:  # pylint: disable=too-many-public-methods
         await self.async_engine.dispose(close=False)
         await asyncio.sleep(0.5)
 
+        self._unknown_user_names.clear()
+
         if keep_app_settings:
             # TODO: adapt update_app_settings by adding settings_id
             #   if there is a multi user mode later
@@ -1360,8 +1379,43 @@ class DBManager:  # pylint: disable=too-many-public-methods
             await self._import_sql_dump(
                 sql_dump=backup_database_dump_bytes.getvalue(),
             )
+            await self.bump_data_version()
             raise
 
+        # the dump contains an older data version, the version must not go back
+        await self.bump_data_version()
+
+    async def get_data_version(self) -> int:
+        """Get the current data version. The version increases with each committed
+        change of the data tables (bumped by database triggers).
+
+        :return: The data version.
+        :rtype: :class:`int`
+        """
+
+        async with self.async_engine.connect() as connection:
+            result: Result = await connection.execute(
+                text("SELECT version FROM data_version WHERE id = 1"),
+            )
+
+        return cast(int, result.scalar_one())
+
+    async def bump_data_version(self) -> int:
+        """Increase the data version, needed for data changes, which bypass the
+        database triggers (e.g. restoring a sql dump).
+
+        :return: The new data version.
+        :rtype: :class:`int`
+        """
+
+        async with self.async_engine.begin() as connection:
+            await connection.execute(text("SELECT bump_data_version()"))
+            result: Result = await connection.execute(
+                text("SELECT version FROM data_version WHERE id = 1"),
+            )
+
+        return cast(int, result.scalar_one())
+
     async def _import_sql_dump(
         self,
         sql_dump: bytes,
@@ -1402,6 +1456,9 @@ class DBManager:  # pylint: disable=too-many-public-methods
                         message=stderr.decode("utf-8"),
                     )
 
+        # imported users may have been cached as unknown in the meantime
+        self._unknown_user_names.clear()
+
     async def _exists_active_user_name(
         self, user_name: str, exclude_ids: list[int] | None = None
     ) -> bool:
@@ -1463,6 +1520,8 @@ class DBManager:  # pylint: disable=too-many-public-methods
         if user_exists:
             raise UserNameAlreadyExistError(user_name=user_name)
 
+        self._unknown_user_names.pop(user_name, None)
+
         user: User = cast(
             User,
             await create_instance(
@@ -1542,6 +1601,7 @@ class DBManager:  # pylint: disable=too-many-public-methods
                 data={"user_login": new_user_name},
             ),
         )
+        self._unknown_user_names.pop(new_user_name, None)
 
         return updated_user.asdict()
 
@@ -1587,6 +1647,14 @@ class DBManager:  # pylint: disable=too-many-public-methods
         :rtype: :class:`dict[str, Any] | None`
         """
 
+        unknown_until: float | None = self._unknown_user_names.get(user_name)
+
+        if unknown_until is not None:
+            if unknown_until > time.monotonic():
+                return None
+
+            del self._unknown_user_names[user_name]
+
         stmt: Select = select(User).where(  # type: ignore
             and_(
                 User.user_login == user_name,
@@ -1602,7 +1670,17 @@ class DBManager:  # pylint: disable=too-many-public-methods
             result.scalars().one_or_none(),
         )
 
-        if user is None or not await self.verify_password(
+        if user is None:
+            self._unknown_user_names[user_name] = (
+                time.monotonic() + UNKNOWN_USER_NAMES_CACHE_TTL
+            )
+
+            while len(self._unknown_user_names) > UNKNOWN_USER_NAMES_CACHE_SIZE:
+                self._unknown_user_names.popitem(last=False)
+
+            return None
+
+        if not await self.verify_password(
             user_password,
             user.user_password_hash,
         ):
@@ -1657,7 +1735,8 @@ class DBManager:  # pylint: disable=too-many-public-methods
     async def verify_password(
         self, plain_password: str | bytes, hashed_password: str | bytes
     ) -> bool:
-        """Verify the plain_password matches the hashed password.
+        """Verify the plain_password matches the hashed password. bcrypt runs in the
+        bounded thread pool of the password hasher, not on the event loop.
 
         :param plain_password: The plain password.
         :type plain_password: :class:`str` | :class:`bytes`
@@ -1667,16 +1746,14 @@ class DBManager:  # pylint: disable=too-many-public-methods
         :rtype: :class:`bool`
         """
 
-        if isinstance(plain_password, str):
-            plain_password = plain_password.encode("utf-8")
-
-        if isinstance(hashed_password, str):
-            hashed_password = hashed_password.encode("utf-8")
-
-        return bcrypt.checkpw(password=plain_password, hashed_password=hashed_password)
+        return await self.password_hasher.verify(
+            plain_password=plain_password,
+            hashed_password=hashed_password,
+        )
 
     async def get_password_hash(self, password: str | bytes) -> str:
-        """Get hashed password.
+        """Get hashed password. bcrypt runs in the bounded thread pool of the
+        password hasher, not on the event loop.
 
         :param password: The password.
         :type password: :class:`str`
@@ -1684,7 +1761,4 @@ class DBManager:  # pylint: disable=too-many-public-methods
         :rtype: :class:`str`
         """
 
-        if isinstance(password, str):
-            password = password.encode("utf-8")
-
-        return bcrypt.hashpw(password, bcrypt.gensalt(12)).decode()
+        return await self.password_hasher.hash(password=password)
@@ -2,7 +2,43 @@
 
 import asyncio
 from functools import wraps
-from typing import Callable
+from typing import Any, Callable
+
+from src.app_logger import app_logger
+from src.singleton import task_registry
+
+
+async def _run_periodically(  # pylint: disable=too-many-arguments, too-many-positional-arguments
+    obj: Any,
+    func: Callable,
+    func_name: str,
+    interval: float,
+    *args: Any,
+    **kwargs: Any,
+) -> None:
+    """Run the task function endlessly, each execution is tracked by the task registry.
+
+    A failed execution is logged and does not stop the task.
+
+    :param obj: The instance of the task function.
+    :type obj: :class:`Any`
+    :param func: The task function.
+    :type func: :class:`Callable`
+    :param func_name: The name of the task function.
+    :type func_name: :class:`str`
+    :param interval: The interval time in seconds.
+    :type interval: :class:`float`
+    """
+
+    while True:
+        try:
+            async with task_registry.track(task_name=func_name, interval=interval):
+                await func(obj, *args, **kwargs)
+        except Exception as ex:  # pylint: disable=broad-exception-caught
+            app_logger.exception(ex)
+            await obj.print_task(task_name=func_name, message=f"Task failed: {ex!r}")
+
+        await asyncio.sleep(interval)
 
 
 # decorator class
@@ -30,9 +66,8 @@ class every:  # pylint: disable=invalid-name
                     message="Task started ...",
                 )
 
-                while True:
-                    await func(obj, *args, **kwargs)
-                    await asyncio.sleep(interval * 3600)  # wait given interval in hours
+                # wait given interval in hours
+                await _run_periodically(obj, func, func_name, interval * 3600, *args, **kwargs)
 
             return wrapper
 
@@ -59,9 +94,8 @@ class every:  # pylint: disable=invalid-name
                     message="Task started ...",
                 )
 
-                while True:
-                    await func(obj, *args, **kwargs)
-                    await asyncio.sleep(interval * 60)  # wait given interval in minutes
+                # wait given interval in minutes
+                await _run_periodically(obj, func, func_name, interval * 60, *args, **kwargs)
 
             return wrapper
 
@@ -87,9 +121,8 @@ class every:  # pylint: disable=invalid-name
                     message="Start task ...",
                 )
 
-                while True:
-                    await func(obj, *args, **kwargs)
-                    await asyncio.sleep(interval)  # wait given interval in seconds
+                # wait given interval in seconds
+                await _run_periodically(obj, func, func_name, interval, *args, **kwargs)
 
             return wrapper
 
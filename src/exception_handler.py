@@ -28,7 +28,11 @@ from src.db.exceptions import (
     ProcessCommunicationError,
     RecordNotFoundError,
 )
-from src.routes.exceptions import BadUsernameOrPasswordError, MissingSMTPSettingsError
+from src.routes.exceptions import (
+    BadUsernameOrPasswordError,
+    LoginThrottledError,
+    MissingSMTPSettingsError,
+)
 from src.utils import extract_database_violation_error
 
 
@@ -105,6 +109,18 @@ async def response_exception(  # pylint: disable=too-many-return-statements, too
             ),
         )
 
+    if isinstance(exception, LoginThrottledError):
+        return JSONResponse(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            content=jsonable_encoder(
+                HTTPErrorResponse(
+                    message=exception.message,
+                    details=exception.details,
+                ).model_dump(exclude_none=True)
+            ),
+            headers={"Retry-After": str(exception.retry_after)},
+        )
+
     if isinstance(exception, InconsistentDatabaseError):
         return JSONResponse(
             status_code=status.HTTP_409_CONFLICT,
@@ -0,0 +1,214 @@
+"""The shared storage backends of the endpoint rate limiter are located here."""
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from limits.storage import Storage, storage_from_string
+from limits.strategies import STRATEGIES
+from slowapi import Limiter
+
+SQLITE_STORAGE_SCHEME: str = "sqlite"
+"""The uri scheme of the :class:`SQLiteStorage`."""
+
+
+class SQLiteStorage(Storage):
+    """Rate limit storage in a SQLite database file, shared by all worker processes
+    of one host, without any external service.
+
+    Counters are incremented by a single UPSERT statement, which SQLite executes
+    atomically across processes (the database file is locked while writing).
+
+    Supports the `fixed-window` strategy (default of the limiter).
+
+    Uri format (like SQLAlchemy): `sqlite:///relative/path.db` or
+    `sqlite:////absolute/path.db`.
+    """
+
+    STORAGE_SCHEME = [SQLITE_STORAGE_SCHEME]
+
+    PURGE_INTERVAL: int = 1000
+    """Expired counters are deleted after each `PURGE_INTERVAL` increments."""
+
+    def __init__(
+        self,
+        uri: str | None = None,
+        wrap_exceptions: bool = False,
+        **options: float | str | bool,
+    ) -> None:
+        """Initialize the SQLiteStorage instance.
+
+        :param uri: The storage uri, e.g. `sqlite:///temp/rate_limits.db`.
+        :type uri: :class:`str` | :class:`None`
+        :param wrap_exceptions: Wrap sqlite exceptions in `limits.errors.StorageError`.
+        :type wrap_exceptions: :class:`bool`
+        :param options: Ignored further storage options.
+        :type options: :class:`float` | :class:`str` | :class:`bool`
+        """
+
+        if uri is None or not uri.startswith(f"{SQLITE_STORAGE_SCHEME}:///"):
+            raise ValueError(f"Invalid sqlite storage uri, got {uri=}")
+
+        super().__init__(uri, wrap_exceptions=wrap_exceptions, **options)
+
+        self.database_path: Path = Path(uri.removeprefix(f"{SQLITE_STORAGE_SCHEME}:///"))
+        self.database_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock: threading.Lock = threading.Lock()
+        self._increments: int = 0
+        self._connection: sqlite3.Connection = sqlite3.connect(
+            self.database_path,
+            timeout=5,
+            isolation_level=None,  # autocommit, each statement is its own transaction
+            check_same_thread=False,
+        )
+
+        with self._lock:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS rate_limits ("
+                "key TEXT PRIMARY KEY, value INTEGER NOT NULL, expires_at REAL NOT NULL)"
+            )
+
+    @property
+    def base_exceptions(self) -> type[Exception] | tuple[type[Exception], ...]:
+        """The exceptions of the storage backend."""
+
+        return sqlite3.Error
+
+    def incr(self, key: str, expiry: int, amount: int = 1) -> int:
+        """Increment the counter of the given key. An expired counter restarts
+        with a new expiry.
+
+        :param key: The rate limit key.
+        :type key: :class:`str`
+        :param expiry: Seconds until the counter expires.
+        :type expiry: :class:`int`
+        :param amount: The amount to increment, defaults to 1.
+        :type amount: :class:`int`
+        :return: The new counter value.
+        :rtype: :class:`int`
+        """
+
+        now: float = time.time()
+
+        with self._lock:
+            row = self._connection.execute(
+                "INSERT INTO rate_limits (key, value, expires_at) "
+                "VALUES (:key, :amount, :expires_at) "
+                "ON CONFLICT (key) DO UPDATE SET "
+                "value = CASE WHEN expires_at <= :now "
+                "THEN excluded.value ELSE value + excluded.value END, "
+                "expires_at = CASE WHEN expires_at <= :now "
+                "THEN excluded.expires_at ELSE expires_at END "
+                "RETURNING value",
+                {"key": key, "amount": amount, "expires_at": now + expiry, "now": now},
+            ).fetchone()
+
+            self._increments += 1
+
+            if self._increments % self.PURGE_INTERVAL == 0:
+                self._connection.execute(
+                    "DELETE FROM rate_limits WHERE expires_at <= ?",
+                    (now,),
+                )
+
+        return int(row[0])
+
+    def get(self, key: str) -> int:
+        """Get the counter of the given key.
+
+        :param key: The rate limit key.
+        :type key: :class:`str`
+        :return: The counter value, 0 if not existing or expired.
+        :rtype: :class:`int`
+        """
+
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value FROM rate_limits WHERE key = ? AND expires_at > ?",
+                (key, time.time()),
+            ).fetchone()
+
+        return 0 if row is None else int(row[0])
+
+    def get_expiry(self, key: str) -> float:
+        """Get the expiry of the counter of the given key.
+
+        :param key: The rate limit key.
+        :type key: :class:`str`
+        :return: The expiry as timestamp, now if not existing or expired.
+        :rtype: :class:`float`
+        """
+
+        now: float = time.time()
+
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT expires_at FROM rate_limits WHERE key = ? AND expires_at > ?",
+                (key, now),
+            ).fetchone()
+
+        return now if row is None else float(row[0])
+
+    def check(self) -> bool:
+        """Check, if the database file is usable.
+
+        :return: True if healthy, otherwise False.
+        :rtype: :class:`bool`
+        """
+
+        try:
+            with self._lock:
+                self._connection.execute("SELECT 1").fetchone()
+        except sqlite3.Error:
+            return False
+
+        return True
+
+    def reset(self) -> int | None:
+        """Delete all counters.
+
+        :return: The number of deleted counters.
+        :rtype: :class:`int` | :class:`None`
+        """
+
+        with self._lock:
+            return self._connection.execute("DELETE FROM rate_limits").rowcount
+
+    def clear(self, key: str) -> None:
+        """Delete the counter of the given key.
+
+        :param key: The rate limit key.
+        :type key: :class:`str`
+        """
+
+        with self._lock:
+            self._connection.execute("DELETE FROM rate_limits WHERE key = ?", (key,))
+
+    def close(self) -> None:
+        """Close the database connection."""
+
+        with self._lock:
+            self._connection.close()
+
+
+def configure_limiter_storage(limiter: Limiter, storage_uri: str) -> None:
+    """Replace the storage of the given limiter.
+
+    The global limiter has to exist at import time (for the route decorators), but
+    the storage settings are known not before the app starts.
+
+    :param limiter: The limiter.
+    :type limiter: :class:`Limiter`
+    :param storage_uri: The storage uri, e.g. `memory://` or `sqlite:///temp/rate_limits.db`.
+    :type storage_uri: :class:`str`
+    """
+
+    storage: Storage = storage_from_string(storage_uri)
+
+    # pylint: disable=protected-access
+    limiter._storage_uri = storage_uri
+    limiter._storage = storage
+    limiter._limiter = STRATEGIES[limiter._strategy or "fixed-window"](storage)
@@ -17,7 +17,9 @@ from src.db.db_manager import DBManager
 from src.exception_handler import response_exception
 from src.fastapi_metadata import tags_metadata
 from src.fastapi_utils import handle_requests, register_router
+from src.limiter_storage import configure_limiter_storage
 from src.report_sender.email_sender.sender import EmailSender
+from src.singleton import limiter
 from src.task_runner import BackgroundTaskRunner
 from src.utils import get_app_data, get_app_env_variables
 
@@ -41,6 +43,11 @@ async def lifespan(fastapi_app: FastAPI) -> AsyncGenerator:
     register_router(fastapi_app=fastapi_app)
 
     print("Initialize app states ...", flush=True)
+    configure_limiter_storage(
+        limiter=limiter,
+        storage_uri=app_env_variables.rate_limit_storage_uri,
+    )
+
     # create db_manager, email_sender and background task runner
     db_manager: DBManager = DBManager(
         db_settings=app_env_variables,
@@ -68,6 +75,8 @@ async def lifespan(fastapi_app: FastAPI) -> AsyncGenerator:
     yield
 
     await background_tasks_runner.stop_tasks()
+    await email_sender.close()
+    db_manager.password_hasher.close()
 
     # deconstruct app here
 
@@ -0,0 +1,122 @@
+"""The circuit breaker around the smtp transport is located here."""
+
+import time
+from datetime import datetime, timezone
+from typing import Any
+
+from src.custom_types import CircuitBreakerStateType
+
+
+class CircuitBreaker:
+    """The CircuitBreaker short-circuits requests to an unhealthy service.
+
+    After `failure_threshold` consecutive failures the breaker opens and rejects all
+    requests. When `recovery_timeout` seconds are over, the breaker is half-open and
+    lets one trial request pass: a success closes the breaker, a failure opens it again.
+    """
+
+    def __init__(self, failure_threshold: int = 3, recovery_timeout: float = 300) -> None:
+        """Initialize the CircuitBreaker instance.
+
+        :param failure_threshold: The number of consecutive failures, which opens the
+            breaker, defaults to 3.
+        :type failure_threshold: :class:`int`
+        :param recovery_timeout: Seconds until an open breaker lets a trial request
+            pass, defaults to 300.
+        :type recovery_timeout: :class:`float`
+        """
+
+        if failure_threshold < 1:
+            raise ValueError(f"failure_threshold must be >= 1, got {failure_threshold=}")
+
+        self.failure_threshold: int = failure_threshold
+        self.recovery_timeout: float = recovery_timeout
+
+        self.consecutive_failures: int = 0
+        self.success_count: int = 0
+        self.failure_count: int = 0
+        self.short_circuit_count: int = 0
+        self.opened_count: int = 0
+        self.opened_at: datetime | None = None
+        self.last_failure_at: datetime | None = None
+
+        self._opened_at_monotonic: float | None = None
+        self._trial_request_pending: bool = False
+
+    @property
+    def state(self) -> CircuitBreakerStateType:
+        """Property to get the current breaker state."""
+
+        if self._opened_at_monotonic is None:
+            return CircuitBreakerStateType.CLOSED
+
+        if time.monotonic() - self._opened_at_monotonic >= self.recovery_timeout:
+            return CircuitBreakerStateType.HALF_OPEN
+
+        return CircuitBreakerStateType.OPEN
+
+    def allow_request(self) -> bool:
+        """Check, if a request may pass the breaker. Rejected requests are counted.
+
+        :return: True, if the request may pass, False, if it is short-circuited.
+        :rtype: :class:`bool`
+        """
+
+        match self.state:
+            case CircuitBreakerStateType.CLOSED:
+                return True
+            case CircuitBreakerStateType.HALF_OPEN if not self._trial_request_pending:
+                self._trial_request_pending = True
+                return True
+
+        self.short_circuit_count += 1
+        return False
+
+    def record_success(self) -> None:
+        """Record a successful request, closes the breaker."""
+
+        self.success_count += 1
+        self.consecutive_failures = 0
+        self._opened_at_monotonic = None
+        self._trial_request_pending = False
+        self.opened_at = None
+
+    def record_failure(self) -> None:
+        """Record a failed request, opens the breaker if the failure threshold is
+        reached or the trial request failed."""
+
+        self.failure_count += 1
+        self.consecutive_failures += 1
+        self.last_failure_at = datetime.now(tz=timezone.utc)
+
+        if (
+            self._trial_request_pending
+            or (
+                self.consecutive_failures >= self.failure_threshold
+                and self._opened_at_monotonic is None
+            )
+        ):
+            self._opened_at_monotonic = time.monotonic()
+            self._trial_request_pending = False
+            self.opened_at = self.last_failure_at
+            self.opened_count += 1
+
+    def status(self) -> dict[str, Any]:
+        """Get the breaker state and its counters.
+
+        :return: The breaker status.
+        :rtype: :class:`dict[str, Any]`
+        """
+
+        return {
+            "state": self.state,
+            "failure_threshold": self.failure_threshold,
+            "recovery_timeout": self.recovery_timeout,
+            "consecutive_failures": self.consecutive_failures,
+            "success_count": self.success_count,
+            "failure_count": self.failure_count,
+            "short_circuit_count": self.short_circuit_count,
+            "opened_count": self.opened_count,
+            "opened_at": self.opened_at,
+            "last_failure_at": self.last_failure_at,
+        }
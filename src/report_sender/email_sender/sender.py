@@ -1,21 +1,35 @@
 """The Email Sender stuff is located here."""
 
+import asyncio
+import json
 from collections.abc import Iterable
 from datetime import datetime, timezone
 from email.message import EmailMessage
 from pathlib import Path
 from typing import Any
 
-from aiosmtplib import SMTP
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from aiosmtplib import SMTP, SMTPException
+from jinja2 import (
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    Template,
+    select_autoescape,
+)
 
+from src.app_logger import app_logger
 from src.constants import SENDER_ROOT_DIR_PATH
 from src.custom_types import AppEnvVariables
 from src.db.db_manager import DBManager
+from src.report_sender.email_sender.circuit_breaker import CircuitBreaker
+from src.report_sender.email_sender.smtp_pool import SMTPConnection, SMTPConnectionPool
 from src.report_sender.sender import ReportSender
 from src.routes.exceptions import MissingSMTPSettingsError
 from src.utils import get_app_data, tabulate_str
 
+RENDERED_REPORTS_CACHE_SIZE: int = 16
+"""The max number of cached rendered automated savings reports."""
+
 
 class EmailSender(ReportSender):
     """The EmailSender class is responsible for sending emails."""
@@ -34,18 +48,31 @@ class EmailSender(ReportSender):
         """
 
         self.smtp_settings: AppEnvVariables = smtp_settings
+        self.smtp_pool: SMTPConnectionPool = SMTPConnectionPool(
+            client_factory=self._create_smtp_client,
+            max_connections=smtp_settings.smtp_max_connections,
+        )
 
         sender_template_path: Path = SENDER_ROOT_DIR_PATH / "email_sender" / "templates"
 
+        # templates are compiled once, the bytecode cache skips compiling after restarts
         jinja_env: Environment = Environment(
             loader=FileSystemLoader(sender_template_path),
             autoescape=select_autoescape(["html", "xml"]),
+            bytecode_cache=FileSystemBytecodeCache(),
+            auto_reload=False,
         )
         super().__init__(
             db_manager=db_manager,
             jinja_env=jinja_env,
         )
 
+        self.automated_savings_done_template: Template = self.jinja_env.get_template(
+            "automated_savings_done.html",
+        )
+        self._rendered_reports: dict[str, tuple[str, str]] = {}
+        self.circuit_breaker: CircuitBreaker = CircuitBreaker()
+
     async def send_testemail(self, to: str) -> None:
         """The test email sender function to test the SMTP outgoing data settings.
 
@@ -71,6 +98,7 @@ class EmailSender(ReportSender):
         self,
         to: str,
         subject: str,
+        moneyboxes: list[dict[str, Any]] | None = None,
     ) -> bool:
         """The send email function which will be called after automated savings
         is done successfully.
@@ -79,78 +107,145 @@ class EmailSender(ReportSender):
         :type to: :class:`str`
         :param subject: The email subject.
         :type subject: :class:`str`
+        :param moneyboxes: The moneyboxes snapshot of the automated savings run, if None,
+            the current moneyboxes will be loaded from database, defaults to None.
+        :type moneyboxes: :class:`list[dict[str, Any]]` | :class:`None`
         :return: True, if sending mail was successful, False if not.
         :rtype: :class:`bool`
         """
 
-        message_data: dict[str, list[dict[str, Any]]] = {
-            "moneyboxes": await self.db_manager.get_moneyboxes()
-        }
-
-        plain_message, html_message = await self._render_automated_savings_report(
-            message_data=message_data,
+        results: list[bool] = await self.send_emails_automated_savings_done_successfully(
+            to=to,
+            reports=[(subject, moneyboxes)],
         )
-        receiver: dict[str, str] = {
-            "to": to,
-            "subj": subject,
-        }
 
-        response_message = await self._send_message(
-            plain_message=plain_message,
-            html_message=html_message,
-            receiver=receiver,
-        )
+        return results[0]
+
+    async def send_emails_automated_savings_done_successfully(
+        self,
+        to: str,
+        reports: list[tuple[str, list[dict[str, Any]] | None]],
+    ) -> list[bool]:
+        """The batch version of :meth:`send_email_automated_savings_done_successfully`.
+        All reports are sent concurrently over the pooled smtp connections.
+
+        Each report is rendered from its moneyboxes snapshot, taken by the
+        automated savings run. The database is only read once for reports without
+        snapshot (action logs, created before snapshots were introduced).
 
-        return "Requested mail action okay, completed: id=" in response_message
+        :param to: The email recipient.
+        :type to: :class:`str`
+        :param reports: The reports to send, one email per tuple of subject and
+            moneyboxes snapshot (or None).
+        :type reports: :class:`list[tuple[str, list[dict[str, Any]] | None]]`
+        :return: A list of send results in the order of the given reports, True,
+            if sending mail was successful, False if not.
+        :rtype: :class:`list[bool]`
+        """
+
+        if not reports:
+            return []
+
+        current_moneyboxes: list[dict[str, Any]] | None = None
+        messages: list[dict[str, Any]] = []
+
+        for subject, moneyboxes in reports:
+            if moneyboxes is None:
+                if current_moneyboxes is None:
+                    current_moneyboxes = await self.db_manager.get_moneyboxes()
+
+                moneyboxes = current_moneyboxes
 
-    async def _render_automated_savings_report(  # pylint: disable=too-many-locals
+            plain_message, html_message = self._render_automated_savings_report(
+                moneyboxes=moneyboxes,
+            )
+            messages.append(
+                {
+                    "receiver": {"to": to, "subj": subject},
+                    "plain_message": plain_message,
+                    "html_message": html_message,
+                }
+            )
+
+        response_messages: list[str | None] = await self._send_messages(messages=messages)
+
+        return [
+            response_message is not None
+            and "Requested mail action okay, completed: id=" in response_message
+            for response_message in response_messages
+        ]
+
+    def _render_automated_savings_report(
         self,
-        message_data: dict[str, Any],
+        moneyboxes: list[dict[str, Any]],
     ) -> tuple[str, str]:
-        """Helper function to prepare sending data for automated savings report.
+        """Helper function to render the automated savings report. Rendered reports
+        are cached by their moneyboxes data, so unchanged reports are not rebuilt.
 
-        :param message_data: The message data
-        :type message_data: :class:`dict[str, Any]`
+        :param moneyboxes: The moneyboxes to report, at least with name, balance and
+            priority.
+        :type moneyboxes: :class:`list[dict[str, Any]]`
 
         :return: The rendered message as plaint text and htl test as tuple.
         :rtype: :class:`tuple[str, str]`
         """
 
-        jinja_template_file: str = "automated_savings_done.html"
+        cache_key: str = json.dumps(
+            [
+                [moneybox["name"], moneybox["balance"], moneybox["priority"]]
+                for moneybox in moneyboxes
+            ],
+        )
+
+        if cache_key not in self._rendered_reports:
+            if len(self._rendered_reports) >= RENDERED_REPORTS_CACHE_SIZE:
+                # drop the oldest rendered report
+                del self._rendered_reports[next(iter(self._rendered_reports))]
+
+            self._rendered_reports[cache_key] = self._build_automated_savings_report(
+                moneyboxes=moneyboxes,
+            )
+
+        return self._rendered_reports[cache_key]
+
+    def _build_automated_savings_report(
+        self,
+        moneyboxes: list[dict[str, Any]],
+    ) -> tuple[str, str]:
+        """Helper function to build the plain and html automated savings report.
+
+        :param moneyboxes: The moneyboxes to report, at least with name, balance and
+            priority.
+        :type moneyboxes: :class:`list[dict[str, Any]]`
+
+        :return: The rendered message as plaint text and htl test as tuple.
+        :rtype: :class:`tuple[str, str]`
+        """
 
         # sort by priority
-        message_data["moneyboxes"] = sorted(
-            message_data["moneyboxes"],
+        sorted_moneyboxes: list[dict[str, Any]] = sorted(
+            moneyboxes,
             key=lambda moneybox: moneybox["priority"],
         )
 
-        total_balance: int = sum(
-            int(moneybox["balance"]) for moneybox in message_data["moneyboxes"]
-        )
+        total_balance: int = sum(int(moneybox["balance"]) for moneybox in sorted_moneyboxes)
         total_balance_str: str = f"{total_balance / 100:,.2f} €"
 
-        # cast balances to float
-        for moneybox in message_data["moneyboxes"]:
-            balance_str: str = f"{int(moneybox['balance']) / 100:,.2f} €"
-            moneybox["balance"] = balance_str
-
-        # reduce name length and set fix with for all data
-        for moneybox in message_data["moneyboxes"]:
-            for key, value in moneybox.items():
-                value = str(value)
-                if len(value) > 23:
-                    value = value[:20] + "..."
-
-                moneybox[key] = str(value)
-
-        # remove moneybox data, keep: name, balance
-        message_data["moneyboxes"] = [
-            {"moneybox_name": moneybox["name"], "balance": moneybox["balance"]}
-            for moneybox in message_data["moneyboxes"]
+        def _fixed_width(value: str) -> str:
+            # reduce name length and set fix with for all data
+            return value[:20] + "..." if len(value) > 23 else value
+
+        # keep moneybox data: name, balance (cast to float)
+        table_data: list[dict[str, str]] = [
+            {
+                "moneybox_name": _fixed_width(str(moneybox["name"])),
+                "balance": _fixed_width(f"{int(moneybox['balance']) / 100:,.2f} €"),
+            }
+            for moneybox in sorted_moneyboxes
         ]
 
-        headers: list[str] = [header.upper() for header in message_data["moneyboxes"][0].keys()]
-        rows: list[Iterable] = [data.values() for data in message_data["moneyboxes"]]
+        headers: list[str] = [header.upper() for header in table_data[0].keys()]
+        rows: list[Iterable] = [data.values() for data in table_data]
 
         header_string: str = (
             f"{self.versioned_app_name}: automated savings done. :)\n"
@@ -167,23 +262,73 @@ class EmailSender(ReportSender):
         header_string_2: str = "Your new moneybox balances:"
 
         app_data_info: dict[str, Any] = get_app_data()
-        html_message: str = self.jinja_env.get_template(jinja_template_file).render(
+        html_message: str = self.automated_savings_done_template.render(
             app_name=app_data_info["name"],
             app_version=app_data_info["version"],
             header_string_1=header_string_1,
             header_string_2=header_string_2,
             moneyboxes_table_header=[header.lower() for header in headers],
-            moneyboxes_table_data=message_data["moneyboxes"],
+            moneyboxes_table_data=table_data,
             total_balance=total_balance_str,
         )
 
         return plain_message, html_message
 
+    async def _send_messages(self, messages: list[dict[str, Any]]) -> list[str | None]:
+        """Sends the given messages concurrently. Each worker checks out one
+        pooled smtp connection and sends its share of the messages over that
+        single session (one batch per connection).
+
+        A failed message does not abort the batch, the error is logged and the
+        related result is None. All sends pass the circuit breaker, messages
+        short-circuited by the open breaker are not sent and their result is None.
+
+        :param messages: The messages to send, each one a dict with the kwargs of
+            :meth:`_send_message`.
+        :type messages: :class:`list[dict[str, Any]]`
+        :return: The status messages of the email send responses in the order
+            of the given messages, None, if sending failed.
+        :rtype: :class:`list[str | None]`
+        """
+
+        pending_messages: asyncio.Queue = asyncio.Queue()
+
+        for i, message in enumerate(messages):
+            pending_messages.put_nowait((i, message))
+
+        response_messages: list[str | None] = [None] * len(messages)
+
+        async def send_batch() -> None:
+            async with self.smtp_pool.connection() as smtp_connection:
+                while not pending_messages.empty():
+                    i, message = pending_messages.get_nowait()
+
+                    if not self.circuit_breaker.allow_request():
+                        # smtp server is unhealthy, don't pay the connection timeouts
+                        continue
+
+                    try:
+                        response_messages[i] = await self._send_message(
+                            **message,
+                            smtp_connection=smtp_connection,
+                        )
+                    except (SMTPException, OSError) as ex:
+                        app_logger.exception(ex)
+                        self.circuit_breaker.record_failure()
+                    else:
+                        self.circuit_breaker.record_success()
+
+        workers_count: int = min(self.smtp_pool.max_connections, len(messages))
+        await asyncio.gather(*(send_batch() for _ in range(workers_count)))
+
+        return response_messages
+
     async def _send_message(  # pylint: disable=arguments-differ
         self,
         receiver: dict[str, Any],
         plain_message: str,
         html_message: str | None = None,
+        smtp_connection: SMTPConnection | None = None,
     ) -> str:
         """Sends a multipart email via smtp client to receiver, if
          html_message is given, if not, keep text/plain only.
@@ -194,6 +339,9 @@ class EmailSender(ReportSender):
         :type plain_message: :class:`str`
         :param html_message: The plain text message to send, defaults to None.
         :type html_message: :class:`str`|:class:`None`
+        :param smtp_connection: The smtp connection to use, if None, a connection
+            will be checked out from the smtp pool, defaults to None.
+        :type smtp_connection: :class:`SMTPConnection`|:class:`None`
         :return: The status message of email send response.
         :rtype: :class:`str`
         """
@@ -216,7 +364,28 @@ class EmailSender(ReportSender):
             # Add the HTML content as an alternative
             email_message.add_alternative(html_message, subtype="html")
 
-        async with SMTP(
+        if smtp_connection is not None:
+            return await smtp_connection.send_message(
+                email_message,
+                sender=_sender,
+                recipients=to,
+            )
+
+        async with self.smtp_pool.connection() as pooled_smtp_connection:
+            return await pooled_smtp_connection.send_message(
+                email_message,
+                sender=_sender,
+                recipients=to,
+            )
+
+    def _create_smtp_client(self) -> SMTP:
+        """Creates a new (unconnected) smtp client based on the smtp settings.
+
+        :return: The smtp client.
+        :rtype: :class:`SMTP`
+        """
+
+        return SMTP(
             hostname=self.smtp_settings.smtp_server,
             port=self.smtp_settings.smtp_port,
             username=self.smtp_settings.smtp_user_name,
@@ -224,6 +393,9 @@ class EmailSender(ReportSender):
             start_tls=self.smtp_settings.smtp_method == "starttls",
             use_tls=self.smtp_settings.smtp_method == "tls",
             timeout=90,
-        ) as client:
-            response = await client.send_message(email_message, sender=_sender, recipients=to)
-            return response[1]
+        )
+
+    async def close(self) -> None:
+        """Close all pooled smtp connections."""
+
+        await self.smtp_pool.close()
@@ -0,0 +1,180 @@
+"""The SMTP connection pool used by the EmailSender is located here."""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from email.message import EmailMessage
+from typing import AsyncGenerator, Callable
+
+from aiosmtplib import (
+    SMTP,
+    SMTPConnectError,
+    SMTPServerDisconnected,
+    SMTPTimeoutError,
+)
+
+RECONNECT_EXCEPTIONS: tuple[type[Exception], ...] = (
+    SMTPServerDisconnected,
+    SMTPConnectError,
+    SMTPTimeoutError,
+    ConnectionError,
+)
+"""Exceptions which mark a smtp session as broken, a reconnect will be tried once."""
+
+
+class SMTPConnection:
+    """A reusable smtp session, which connects lazily on the first sent message
+    and reconnects, if the server dropped the session in the meantime."""
+
+    def __init__(self, client_factory: Callable[[], SMTP]) -> None:
+        """Initialize the SMTPConnection instance.
+
+        :param client_factory: Factory function, which creates a new (unconnected)
+            smtp client.
+        :type client_factory: :class:`Callable[[], SMTP]`
+        """
+
+        self.client_factory: Callable[[], SMTP] = client_factory
+        self.client: SMTP | None = None
+        self.last_used_at: float = time.monotonic()
+
+    @property
+    def is_connected(self) -> bool:
+        """Property to check, if the smtp session is established."""
+
+        return self.client is not None and self.client.is_connected
+
+    async def send_message(
+        self,
+        message: EmailMessage,
+        sender: str,
+        recipients: str,
+    ) -> str:
+        """Send the message over the current smtp session. If the session is broken,
+        the connection will be re-established and sending is retried once.
+
+        :param message: The email message to send.
+        :type message: :class:`EmailMessage`
+        :param sender: The sender address.
+        :type sender: :class:`str`
+        :param recipients: The recipient address.
+        :type recipients: :class:`str`
+        :return: The status message of the smtp server response.
+        :rtype: :class:`str`
+        """
+
+        if not self.is_connected:
+            await self._connect()
+
+        try:
+            response = await self.client.send_message(  # type: ignore
+                message,
+                sender=sender,
+                recipients=recipients,
+            )
+        except RECONNECT_EXCEPTIONS:
+            # session was dropped by the server, reconnect and retry once
+            await self.close()
+            await self._connect()
+
+            try:
+                response = await self.client.send_message(  # type: ignore
+                    message,
+                    sender=sender,
+                    recipients=recipients,
+                )
+            except RECONNECT_EXCEPTIONS:
+                await self.close()
+                raise
+
+        self.last_used_at = time.monotonic()
+        return response[1]
+
+    async def _connect(self) -> None:
+        """Create a new smtp client and connect to the smtp server."""
+
+        self.client = self.client_factory()
+        await self.client.connect()
+
+    async def close(self) -> None:
+        """Close the smtp session, errors while closing will be ignored."""
+
+        if self.client is None:
+            return
+
+        client, self.client = self.client, None
+
+        if client.is_connected:
+            try:
+                await client.quit()
+            except Exception:  # pylint: disable=broad-exception-caught
+                client.close()
+
+
+class SMTPConnectionPool:
+    """The SMTPConnectionPool holds up to `max_connections` reusable smtp sessions.
+
+    Connections are handed out by :meth:`connection` and returned to the pool
+    afterward. Sessions idling longer than `idle_timeout` seconds will be closed on
+    the next checkout, because most smtp servers drop idle clients anyway.
+    """
+
+    def __init__(
+        self,
+        client_factory: Callable[[], SMTP],
+        max_connections: int,
+        idle_timeout: float = 60,
+    ) -> None:
+        """Initialize the SMTPConnectionPool instance.
+
+        :param client_factory: Factory function, which creates a new (unconnected)
+            smtp client.
+        :type client_factory: :class:`Callable[[], SMTP]`
+        :param max_connections: The max number of parallel smtp sessions.
+        :type max_connections: :class:`int`
+        :param idle_timeout: Seconds until an idle session will be closed, defaults to 60.
+        :type idle_timeout: :class:`float`
+        """
+
+        if max_connections < 1:
+            raise ValueError(f"max_connections must be >= 1, got {max_connections=}")
+
+        self.client_factory: Callable[[], SMTP] = client_factory
+        self.max_connections: int = max_connections
+        self.idle_timeout: float = idle_timeout
+        self._semaphore: asyncio.Semaphore = asyncio.Semaphore(max_connections)
+        self._idle_connections: list[SMTPConnection] = []
+
+    @asynccontextmanager
+    async def connection(self) -> AsyncGenerator[SMTPConnection, None]:
+        """Check out a smtp connection from the pool. Waits, if all connections
+        are in use.
+
+        :return: A smtp connection as async context manager.
+        :rtype: :class:`AsyncGenerator[SMTPConnection, None]`
+        """
+
+        async with self._semaphore:
+            if self._idle_connections:
+                smtp_connection: SMTPConnection = self._idle_connections.pop()
+
+                if time.monotonic() - smtp_connection.last_used_at > self.idle_timeout:
+                    await smtp_connection.close()
+            else:
+                smtp_connection = SMTPConnection(client_factory=self.client_factory)
+
+            try:
+                yield smtp_connection
+            except BaseException:
+                await smtp_connection.close()
+                raise
+
+            self._idle_connections.append(smtp_connection)
+
+    async def close(self) -> None:
+        """Close all idle smtp sessions of the pool."""
+
+        idle_connections, self._idle_connections = self._idle_connections, []
+
+        for smtp_connection in idle_connections:
+            await smtp_connection.close()
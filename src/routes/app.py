@@ -10,17 +10,19 @@ from starlette.requests import Request
 from starlette.responses import JSONResponse, Response
 
 from src.auth.jwt_auth import UserAuthJWTBearer
-from src.custom_types import EndpointRouteType
+from src.custom_types import EndpointRouteType, UserRoleType
 from src.data_classes.requests import LoginUserRequest, ResetDataRequest
-from src.data_classes.responses import AppInfoResponse, LoginUserResponse
+from src.data_classes.responses import AppInfoResponse, LoginUserResponse, TasksResponse
 from src.db.db_manager import DBManager
-from src.routes.exceptions import BadUsernameOrPasswordError
+from src.routes.exceptions import BadUsernameOrPasswordError, LoginThrottledError
 from src.routes.responses.app import (
     DELETE_APP_LOGOUT_RESPONSES,
     GET_APP_METADATA_RESPONSES,
+    GET_APP_TASKS_RESPONSES,
     POST_APP_LOGIN_RESPONSES,
     POST_APP_RESET_RESPONSES,
 )
+from src.singleton import login_throttle, task_registry
 from src.utils import get_app_data
 
 app_router: APIRouter = APIRouter(
@@ -52,6 +54,36 @@ async def get_app_metadata_endpoint() -> AppInfoResponse:
     }
 
 
+@app_router.get(
+    "/tasks",
+    response_model=TasksResponse,
+    responses=GET_APP_TASKS_RESPONSES,
+)
+async def get_app_tasks_endpoint(
+    jwt_authorize: Annotated[  # pylint: disable=unused-argument
+        AuthJWT,
+        Depends(
+            UserAuthJWTBearer(
+                access_limited_to_roles=[UserRoleType.ADMIN],
+            )
+        ),
+    ],
+) -> TasksResponse:
+    """*Required user role: ADMIN*
+
+    Endpoint for getting the execution stats of all background tasks, like
+    duration, outcome, exception, rows touched and last/next run.
+    \f
+
+    :param jwt_authorize: The authorized user token.
+    :type jwt_authorize: :class:`AuthJWT`
+    :return: The execution stats of all background tasks.
+    :rtype: :class:`TasksResponse`
+    """
+
+    return {"tasks": task_registry.status()}  # type: ignore
+
+
 @app_router.post(
     "/reset",
     responses=POST_APP_RESET_RESPONSES,
@@ -103,6 +135,19 @@ async def post_app_login_endpoint(
     :rtype: :class:`JSONResponse`
     """
 
+    # reject brute force attempts before the (slow) password hash is verified
+    client_ip: str | None = request.client.host if request.client is not None else None
+    retry_after: int = login_throttle.retry_after(
+        user_name=user_request_data.user_name,
+        ip=client_ip,
+    )
+
+    if retry_after > 0:
+        raise LoginThrottledError(
+            user_name=user_request_data.user_name,
+            retry_after=retry_after,
+        )
+
     db_manager: DBManager = cast(DBManager, request.app.state.db_manager)
     user: dict[str, Any] | None = await db_manager.get_user_by_credentials(
         user_name=user_request_data.user_name,
@@ -110,10 +155,16 @@ async def post_app_login_endpoint(
     )
 
     if user is None:
+        login_throttle.record_failure(
+            user_name=user_request_data.user_name,
+            ip=client_ip,
+        )
         raise BadUsernameOrPasswordError(
             user_name=user_request_data.user_name,
         )
 
+    login_throttle.record_success(user_name=user_request_data.user_name)
+
     user_valid_response_data = LoginUserResponse(**user)
 
     access_token: str = await jwt_authorize.create_access_token(
@@ -4,6 +4,7 @@ from typing import Annotated, Any, cast
 
 from fastapi import APIRouter, Body
 from starlette.requests import Request
+from starlette.responses import Response
 
 from src.custom_types import EndpointRouteType
 from src.data_classes.requests import AppSettingsRequest
@@ -16,6 +17,7 @@ from src.routes.responses.app_settings import (
     GET_APP_SETTINGS_RESPONSES,
     PATCH_APP_SETTINGS_RESPONSES,
 )
+from src.utils import check_data_version_etag
 
 app_settings_router: APIRouter = APIRouter(
     prefix=f"/{EndpointRouteType.APP_SETTINGS}",
@@ -31,16 +33,29 @@ app_settings_router: APIRouter = APIRouter(
 )
 async def get_app_settings_endpoint(
     request: Request,
-) -> AppSettingsResponse:
+    response: Response,
+) -> AppSettingsResponse | Response:
     """Endpoint for getting app settings.
     \f
 
     :param request: The current request object.
     :type request: :class:`Request`
-    :return: The app settings data.
+    :param response: The response, the ETag header will be set to.
+    :type response: :class:`Response`
+    :return: The app settings data or an empty response with status code 304, if
+        the data did not change since the ETag of the `If-None-Match` header.
     """
 
     db_manager: DBManager = cast(DBManager, request.app.state.db_manager)
+    not_modified_response: Response | None = check_data_version_etag(
+        request=request,
+        response=response,
+        data_version=await db_manager.get_data_version(),
+    )
+
+    if not_modified_response is not None:
+        return not_modified_response
+
     # use protected method for now
     app_settings_data: AppSettings = (
         await db_manager._get_app_settings()  # pylint: disable=protected-access
@@ -8,10 +8,14 @@ from starlette.requests import Request
 from starlette.responses import Response
 
 from src.custom_types import EndpointRouteType
+from src.data_classes.responses import EmailSenderStatusResponse
 from src.db.db_manager import DBManager
 from src.db.models import AppSettings
 from src.report_sender.email_sender.sender import EmailSender
-from src.routes.responses.email_sender import PATCH_EMAIL_SEND_TESTEMAIL_RESPONSES
+from src.routes.responses.email_sender import (
+    GET_EMAIL_STATUS_RESPONSES,
+    PATCH_EMAIL_SEND_TESTEMAIL_RESPONSES,
+)
 from src.singleton import limiter
 
 email_router: APIRouter = APIRouter(
@@ -46,3 +50,23 @@ async def patch_email_send_testemail_endpoint(request: Request) -> Response:
     await email_sender.send_testemail(to=app_settings.user_email_address)
 
     return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+@email_router.get(
+    "/status",
+    response_model=EmailSenderStatusResponse,
+    responses=GET_EMAIL_STATUS_RESPONSES,
+)
+async def get_email_status_endpoint(request: Request) -> EmailSenderStatusResponse:
+    """Endpoint for getting the state and counters of the smtp circuit breaker.
+    \f
+
+    :param request: The current request object.
+    :type request: :class:`Request`
+    :return: The email sender status.
+    :rtype: :class:`EmailSenderStatusResponse`
+    """
+
+    email_sender: EmailSender = cast(EmailSender, request.app.state.email_sender)
+
+    return email_sender.circuit_breaker.status()  # type: ignore
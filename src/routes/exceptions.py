@@ -21,3 +21,17 @@ class BadUsernameOrPasswordError(Exception):
             "user_name": user_name,
         }
         super().__init__(self.message)
+
+
+class LoginThrottledError(Exception):
+    """The LoginThrottledError class."""
+
+    def __init__(self, user_name: str, retry_after: int) -> None:
+        self.message: str = "Too many failed logins. Try again later."
+        self.user_name: str = user_name
+        self.retry_after: int = retry_after
+        self.details = {
+            "user_name": user_name,
+            "retry_after": retry_after,
+        }
+        super().__init__(self.message)
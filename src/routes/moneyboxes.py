@@ -26,6 +26,7 @@ from src.routes.responses.moneyboxes import (
 from src.savings_distribution.automated_savings_distribution import (
     AutomatedSavingsDistributionService,
 )
+from src.utils import check_data_version_etag
 
 moneyboxes_router: APIRouter = APIRouter(
     prefix=f"/{EndpointRouteType.MONEYBOXES}",
@@ -41,19 +42,32 @@ moneyboxes_router: APIRouter = APIRouter(
 )
 async def get_moneyboxes_endpoint(
     request: Request,
-) -> MoneyboxesResponse:
+    response: Response,
+) -> MoneyboxesResponse | Response:
     """Endpoint for getting moneyboxes.
     \f
 
     :param request: The current request object.
-    :return: The list of moneyboxes.
-    :rtype: :class:`MoneyboxesResponse`
+    :param response: The response, the ETag header will be set to.
+    :type response: :class:`Response`
+    :return: The list of moneyboxes or an empty response with status code 304, if
+        the data did not change since the ETag of the `If-None-Match` header.
+    :rtype: :class:`MoneyboxesResponse` | :class:`Response`
 
     :raises OverflowMoneyboxNotFoundError: if moneyboxes result is empty, it means, that
         the overflow moneybox is missing. At least the overflow moneybox has into the results.
     """
 
     db_manager: DBManager = cast(DBManager, request.app.state.db_manager)
+    not_modified_response: Response | None = check_data_version_etag(
+        request=request,
+        response=response,
+        data_version=await db_manager.get_data_version(),
+    )
+
+    if not_modified_response is not None:
+        return not_modified_response
+
     moneyboxes_data: list[dict[str, Any]] = await db_manager.get_moneyboxes()
 
     _ = MoneyboxesResponse(moneyboxes=moneyboxes_data)
@@ -71,6 +85,7 @@ async def get_moneyboxes_endpoint(
 )
 async def get_savings_forecast_endpoint(
     request: Request,
+    response: Response,
 ) -> MoneyboxForecastListResponse | Response:
     """Returns a forecast of monthly savings distributions for each moneybox.
 
@@ -82,11 +97,24 @@ async def get_savings_forecast_endpoint(
     \f
 
     :param request: The current request object.
-    :return: A list of moneyboxes and their respective savings distributions.
-    :rtype: :class:`MoneyboxForecastListResponse`
+    :param response: The response, the ETag header will be set to.
+    :type response: :class:`Response`
+    :return: A list of moneyboxes and their respective savings distributions or an empty
+        response with status code 304, if the data did not change since the ETag of the
+        `If-None-Match` header.
+    :rtype: :class:`MoneyboxForecastListResponse` | :class:`Response`
     """
 
     db_manager: DBManager = cast(DBManager, request.app.state.db_manager)
+    not_modified_response: Response | None = check_data_version_etag(
+        request=request,
+        response=response,
+        data_version=await db_manager.get_data_version(),
+    )
+
+    if not_modified_response is not None:
+        return not_modified_response
+
     moneyboxes_data: list[dict[str, Any]] = await db_manager.get_moneyboxes()
 
     # validate before continuing
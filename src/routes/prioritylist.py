@@ -15,6 +15,7 @@ from src.routes.responses.prioritylist import (
     GET_PRIORITYLIST_RESPONSES,
     UPDATE_PRIORITYLIST_RESPONSES,
 )
+from src.utils import check_data_version_etag
 
 prioritylist_router: APIRouter = APIRouter(
     prefix=f"/{EndpointRouteType.PRIORITYLIST}",
@@ -30,6 +31,7 @@ prioritylist_router: APIRouter = APIRouter(
 )
 async def get_prioritylist_endpoint(
     request: Request,
+    response: Response,
 ) -> PrioritylistResponse | Response:
     """Endpoint for getting prioritylist. Note: Returns a list SORTED by priority (asc)
     Note: The overflow moneybox is NOT included.
@@ -37,12 +39,24 @@ async def get_prioritylist_endpoint(
 
     :param request: The current request object.
     :type request: :class:`Request`
+    :param response: The response, the ETag header will be set to.
+    :type response: :class:`Response`
     :return: The prioritylist if not empty, else a response object including status
-        code 204.
+        code 204. Status code 304, if the data did not change since the ETag of the
+        `If-None-Match` header.
     :rtype: :class:`PrioritylistResponse` | :class:`Response`
     """
 
     db_manager: DBManager = cast(DBManager, request.app.state.db_manager)
+    not_modified_response: Response | None = check_data_version_etag(
+        request=request,
+        response=response,
+        data_version=await db_manager.get_data_version(),
+    )
+
+    if not_modified_response is not None:
+        return not_modified_response
+
     priority_list: list[dict[str, int | str]] = await db_manager.get_prioritylist()
 
     if priority_list:
@@ -8,6 +8,7 @@ from src.data_classes.responses import (
     AppInfoResponse,
     HTTPErrorResponse,
     LoginUserResponse,
+    TasksResponse,
 )
 
 GET_APP_METADATA_RESPONSES: dict[status, dict[str, Any]] = {
@@ -209,6 +210,20 @@ POST_APP_LOGIN_RESPONSES: dict[status, dict[str, Any]] = {
             }
         },
     },
+    status.HTTP_429_TOO_MANY_REQUESTS: {
+        "description": "Too Many Requests",
+        "content": {
+            "application/json": {
+                "example": HTTPErrorResponse(
+                    message="Too many failed logins. Try again later.",
+                    details={
+                        "user_name": "pythbuster",
+                        "retry_after": 12,
+                    },
+                )
+            }
+        },
+    },
     status.HTTP_422_UNPROCESSABLE_ENTITY: {
         "description": "Unprocessable Entity",
         "content": {
@@ -292,3 +307,31 @@ DELETE_APP_LOGOUT_RESPONSES: dict[status, dict[str, Any]] = {
     },
 }
 """Responses for endpoint DELETE: /app/logout"""
+
+GET_APP_TASKS_RESPONSES: dict[status, dict[str, Any]] = {
+    status.HTTP_200_OK: {
+        "description": "OK",
+        "model": TasksResponse,
+    },
+    status.HTTP_401_UNAUTHORIZED: {
+        "description": "Unauthorized",
+        "content": {
+            "application/json": {
+                "example": HTTPErrorResponse(
+                    message="Missing cookie savings_manager",
+                )
+            }
+        },
+    },
+    status.HTTP_403_FORBIDDEN: {
+        "description": "Forbidden",
+        "content": {
+            "application/json": {
+                "example": HTTPErrorResponse(
+                    message="Not authorized. Missing role.",
+                )
+            }
+        },
+    },
+}
+"""Responses for endpoint GET: /app/tasks"""
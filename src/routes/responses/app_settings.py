@@ -11,6 +11,10 @@ GET_APP_SETTINGS_RESPONSES: dict[status, dict[str, Any]] = {
         "description": "OK",
         "model": AppSettingsResponse,
     },
+    status.HTTP_304_NOT_MODIFIED: {
+        "description": "Not Modified, the data did not change since the ETag "
+        "of the `If-None-Match` header.",
+    },
     status.HTTP_409_CONFLICT: {
         "description": "Conflict",
         "content": {
@@ -4,7 +4,7 @@ from typing import Any
 
 from starlette import status
 
-from src.data_classes.responses import HTTPErrorResponse
+from src.data_classes.responses import EmailSenderStatusResponse, HTTPErrorResponse
 
 PATCH_EMAIL_SEND_TESTEMAIL_RESPONSES: dict[status, dict[str, Any]] = {
     status.HTTP_204_NO_CONTENT: {
@@ -23,3 +23,11 @@ PATCH_EMAIL_SEND_TESTEMAIL_RESPONSES: dict[status, dict[str, Any]] = {
     },
 }
 """Responses for endpoint GET: /send-testemail."""
+
+GET_EMAIL_STATUS_RESPONSES: dict[status, dict[str, Any]] = {
+    status.HTTP_200_OK: {
+        "description": "OK",
+        "model": EmailSenderStatusResponse,
+    },
+}
+"""Responses for endpoint GET: /status."""
@@ -14,6 +14,10 @@ GET_PRIORITYLIST_RESPONSES: dict[status, dict[str, Any]] = {
     status.HTTP_204_NO_CONTENT: {
         "description": "No Content",
     },
+    status.HTTP_304_NOT_MODIFIED: {
+        "description": "Not Modified, the data did not change since the ETag "
+        "of the `If-None-Match` header.",
+    },
     status.HTTP_409_CONFLICT: {
         "description": "Conflict",
         "content": {
@@ -45,13 +45,24 @@ class AutomatedSavingsDistributionService:
     def __init__(self, db_manager: DBManager):
         self.db_manager = db_manager
 
-    async def run_automated_savings_distribution(self) -> bool:  # pylint:disable=too-many-locals
+    async def run_automated_savings_distribution(
+        self,
+        action_dates: list[datetime] | None = None,
+    ) -> bool:
         """Run the automated savings distribution algorithm.
 
         App savings amount will be distributed to moneyboxes in priority order (excepted the
         Overflow Moneybox). If there is a leftover that could not be distributed,
         the overflow moneybox will get the leftover.
 
+        Missed distributions (e.g. after a server downtime) can be caught up by passing
+        their dates: all distributions are applied in chronological order within one
+        database transaction, each one gets its own action log. Moneyboxes are loaded
+        once, distribution plans are reused for months with unchanged inputs.
+
+        :param action_dates: The dates of the (missed) distributions to apply, if None,
+            one distribution is applied now, defaults to None.
+        :type action_dates: :class:`list[datetime]` | :class:`None`
         :return: True, if savings_distribution is done, false, if automated savings is deactivated.
         :rtype: :class:`bool`
 
@@ -62,10 +73,6 @@ class AutomatedSavingsDistributionService:
         app_settings: AppSettings = (
             await self.db_manager._get_app_settings()  # pylint: disable=protected-access
         )
-        action: OverflowMoneyboxAutomatedSavingsModeType = (
-            app_settings.overflow_moneybox_automated_savings_mode
-        )
-        transaction_description: str = MODE_TO_LOG_DESCRIPTION[action]
 
         if not app_settings.is_automated_saving_active:
             return False
@@ -75,128 +82,216 @@ class AutomatedSavingsDistributionService:
             moneyboxes,
             key=lambda item: item["priority"],
         )
+        distribution_plans: dict[tuple, dict[int, int]] = {}
 
         async with self.db_manager.async_sessionmaker.begin() as session:
-            # Mode 1: COLLECT and Mode 2: ADD_TO_AUTOMATED_SAVINGS_AMOUNT
-            distribution_amount: int = app_settings.savings_amount
-
-            # for MODE 2: ADD
-            if (
-                action is OverflowMoneyboxAutomatedSavingsModeType.ADD_TO_AUTOMATED_SAVINGS_AMOUNT
-                and (overflow_moneybox_amount := sorted_moneyboxes[0]["balance"]) > 0
-            ):
-                withdraw_transaction_data: dict[str, int | str] = {
-                    "amount": overflow_moneybox_amount,
-                    "description": transaction_description,
-                }
-                sorted_moneyboxes[0] = await self.db_manager.sub_amount(
-                    moneybox_id=sorted_moneyboxes[0]["id"],
-                    withdraw_transaction_data=withdraw_transaction_data,
-                    transaction_type=TransactionType.DISTRIBUTION,
-                    transaction_trigger=TransactionTrigger.AUTOMATICALLY,
+            for action_at in sorted(action_dates) if action_dates else [None]:
+                sorted_moneyboxes = await self._run_distribution_cycle(
                     session=session,
+                    app_settings=app_settings,
+                    sorted_moneyboxes=sorted_moneyboxes,
+                    action_at=action_at,
+                    distribution_plans=distribution_plans,
                 )
 
-                # add overflow moneybox balance to savings_distribution amount
-                distribution_amount += overflow_moneybox_amount
+        return True
+
+    async def _run_distribution_cycle(  # noqa: ignore  # pylint:disable=too-many-locals, too-many-arguments, too-many-positional-arguments, too-many-statements
+        self,
+        session: AsyncSession,
+        app_settings: AppSettings,
+        sorted_moneyboxes: list[dict[str, Any]],
+        action_at: datetime | None,
+        distribution_plans: dict[tuple, dict[int, int]],
+    ) -> list[dict[str, Any]]:
+        """Apply one automated savings distribution and log it.
 
-            # calculate savings_distribution amounts for "normal" savings_distribution case
-            distribution_amounts: dict[int, int] = (
+        :param session: Database session.
+        :type session: :class:`AsyncSession`
+        :param app_settings: The app settings.
+        :type app_settings: :class:`AppSettings`
+        :param sorted_moneyboxes: The current moneyboxes, sorted by priority (overflow
+            moneybox included).
+        :type sorted_moneyboxes: :class:`list[dict[str, Any]]`
+        :param action_at: The date of the distribution, if None: now.
+        :type action_at: :class:`datetime` | :class:`None`
+        :param distribution_plans: The already calculated normal distribution plans,
+            keyed by their inputs, will be extended by this cycle.
+        :type distribution_plans: :class:`dict[tuple, dict[int, int]]`
+        :return: The updated moneyboxes, sorted by priority (overflow moneybox included).
+        :rtype: :class:`list[dict[str, Any]]`
+        """
+
+        action: OverflowMoneyboxAutomatedSavingsModeType = (
+            app_settings.overflow_moneybox_automated_savings_mode
+        )
+        transaction_description: str = MODE_TO_LOG_DESCRIPTION[action]
+
+        # don't change the moneyboxes of the caller
+        sorted_moneyboxes = list(sorted_moneyboxes)
+
+        # Mode 1: COLLECT and Mode 2: ADD_TO_AUTOMATED_SAVINGS_AMOUNT
+        distribution_amount: int = app_settings.savings_amount
+
+        # for MODE 2: ADD
+        if (
+            action is OverflowMoneyboxAutomatedSavingsModeType.ADD_TO_AUTOMATED_SAVINGS_AMOUNT
+            and (overflow_moneybox_amount := sorted_moneyboxes[0]["balance"]) > 0
+        ):
+            withdraw_transaction_data: dict[str, int | str] = {
+                "amount": overflow_moneybox_amount,
+                "description": transaction_description,
+            }
+            sorted_moneyboxes[0] = await self.db_manager.sub_amount(
+                moneybox_id=sorted_moneyboxes[0]["id"],
+                withdraw_transaction_data=withdraw_transaction_data,
+                transaction_type=TransactionType.DISTRIBUTION,
+                transaction_trigger=TransactionTrigger.AUTOMATICALLY,
+                session=session,
+            )
+
+            # add overflow moneybox balance to savings_distribution amount
+            distribution_amount += overflow_moneybox_amount
+
+        # calculate savings_distribution amounts for "normal" savings_distribution case,
+        # the plan only depends on these inputs and will be reused if they don't change
+        distribution_plan_key: tuple = (
+            distribution_amount,
+            *(
+                (
+                    moneybox["id"],
+                    moneybox["savings_amount"],
+                    moneybox["savings_target"],
+                    moneybox["balance"] if moneybox["savings_target"] is not None else None,
+                )
+                for moneybox in sorted_moneyboxes
+            ),
+        )
+
+        if distribution_plan_key not in distribution_plans:
+            distribution_plans[distribution_plan_key] = (
                 await AutomatedSavingsDistributionService.calculate_moneybox_amounts_normal_distribution(  # noqa: E501  # pylint: disable=line-too-long
                     sorted_by_priority_moneyboxes=sorted_moneyboxes,
                     distribute_amount=distribution_amount,
                 )
             )
 
-            updated_moneyboxes: list[dict[str, Any]] = (
-                await self._distribute_automated_savings_amount(  # type: ignore  # noqa: ignore  # pylint:disable=line-too-long
+        distribution_amounts: dict[int, int] = distribution_plans[distribution_plan_key]
+
+        updated_moneyboxes: list[dict[str, Any]] = (
+            await self._distribute_automated_savings_amount(  # type: ignore  # noqa: ignore  # pylint:disable=line-too-long
+                session=session,
+                sorted_by_priority_moneyboxes=sorted_moneyboxes,
+                distribution_amounts=distribution_amounts,
+                # use "normal" distribution description
+                distribution_description=MODE_TO_LOG_DESCRIPTION[
+                    OverflowMoneyboxAutomatedSavingsModeType.COLLECT
+                ],
+            )
+        )
+
+        del sorted_moneyboxes
+
+        # latest known state of all moneyboxes, used for the report snapshot
+        latest_moneyboxes: dict[int, dict[str, Any]] = {
+            moneybox["id"]: moneybox for moneybox in updated_moneyboxes
+        }
+
+        # POST-distributions
+        # Mode 3: FILL, Mode 4: RATIO, Mode 5: EQUAL
+        # -> if overflow moneybox has balance to distribute
+        # -> empty overflow moneybox balance and distribute it
+
+        if action in POST_DISTRIBUTION_MODES:
+            last_overflow_moneybox_amount: int = -1
+
+            while (
+                overflow_moneybox_amount := updated_moneyboxes[0]["balance"]
+            ) > 0 and overflow_moneybox_amount != last_overflow_moneybox_amount:
+                withdraw_transaction_data = {
+                    "amount": overflow_moneybox_amount,
+                    "description": transaction_description,
+                }
+                updated_moneyboxes[0] = await self.db_manager.sub_amount(
+                    moneybox_id=updated_moneyboxes[0]["id"],
+                    withdraw_transaction_data=withdraw_transaction_data,
+                    transaction_type=TransactionType.DISTRIBUTION,
+                    transaction_trigger=TransactionTrigger.AUTOMATICALLY,
                     session=session,
-                    sorted_by_priority_moneyboxes=sorted_moneyboxes,
-                    distribution_amounts=distribution_amounts,
-                    # use "normal" distribution description
-                    distribution_description=MODE_TO_LOG_DESCRIPTION[
-                        OverflowMoneyboxAutomatedSavingsModeType.COLLECT
-                    ],
                 )
-            )
+                latest_moneyboxes[updated_moneyboxes[0]["id"]] = updated_moneyboxes[0]
 
-            del sorted_moneyboxes
-
-            # POST-distributions
-            # Mode 3: FILL, Mode 4: RATIO, Mode 5: EQUAL
-            # -> if overflow moneybox has balance to distribute
-            # -> empty overflow moneybox balance and distribute it
-
-            if action in POST_DISTRIBUTION_MODES:
-                last_overflow_moneybox_amount: int = -1
-
-                while (
-                    overflow_moneybox_amount := updated_moneyboxes[0]["balance"]
-                ) > 0 and overflow_moneybox_amount != last_overflow_moneybox_amount:
-                    withdraw_transaction_data = {
-                        "amount": overflow_moneybox_amount,
-                        "description": transaction_description,
-                    }
-                    updated_moneyboxes[0] = await self.db_manager.sub_amount(
-                        moneybox_id=updated_moneyboxes[0]["id"],
-                        withdraw_transaction_data=withdraw_transaction_data,
-                        transaction_type=TransactionType.DISTRIBUTION,
-                        transaction_trigger=TransactionTrigger.AUTOMATICALLY,
-                        session=session,
+                # calculate savings_distribution amounts for modes 3 and 4
+                # FILL:
+                if action is OverflowMoneyboxAutomatedSavingsModeType.FILL_UP_LIMITED_MONEYBOXES:
+                    distribution_amounts = await AutomatedSavingsDistributionService.calculate_moneybox_amounts_fill_distribution(  # noqa: E501  # pylint: disable=line-too-long
+                        sorted_by_priority_moneyboxes=updated_moneyboxes,
+                        distribute_amount=overflow_moneybox_amount,
                     )
+                # RATIO:
+                elif action is OverflowMoneyboxAutomatedSavingsModeType.RATIO:
+                    distribution_amounts = await AutomatedSavingsDistributionService.calculate_moneybox_amounts_ratio_distribution(  # noqa: E501  # pylint: disable=line-too-long
+                        sorted_by_priority_moneyboxes=updated_moneyboxes,
+                        distribute_amount=overflow_moneybox_amount,
+                    )
+                # EQUAL:
+                elif action is OverflowMoneyboxAutomatedSavingsModeType.EQUAL:
+                    distribution_amounts = await AutomatedSavingsDistributionService.calculate_moneybox_amounts_equal_distribution(  # noqa: E501  # pylint: disable=line-too-long
+                        sorted_by_priority_moneyboxes=updated_moneyboxes,
+                        distribute_amount=overflow_moneybox_amount,
+                    )
+                else:
+                    raise ValueError(f"Unknown action: {action}")
 
-                    # calculate savings_distribution amounts for modes 3 and 4
-                    # FILL:
-                    if (
-                        action
-                        is OverflowMoneyboxAutomatedSavingsModeType.FILL_UP_LIMITED_MONEYBOXES
-                    ):
-                        distribution_amounts = await AutomatedSavingsDistributionService.calculate_moneybox_amounts_fill_distribution(  # noqa: E501  # pylint: disable=line-too-long
-                            sorted_by_priority_moneyboxes=updated_moneyboxes,
-                            distribute_amount=overflow_moneybox_amount,
-                        )
-                    # RATIO:
-                    elif action is OverflowMoneyboxAutomatedSavingsModeType.RATIO:
-                        distribution_amounts = await AutomatedSavingsDistributionService.calculate_moneybox_amounts_ratio_distribution(  # noqa: E501  # pylint: disable=line-too-long
-                            sorted_by_priority_moneyboxes=updated_moneyboxes,
-                            distribute_amount=overflow_moneybox_amount,
-                        )
-                    # EQUAL:
-                    elif action is OverflowMoneyboxAutomatedSavingsModeType.EQUAL:
-                        distribution_amounts = await AutomatedSavingsDistributionService.calculate_moneybox_amounts_equal_distribution(  # noqa: E501  # pylint: disable=line-too-long
-                            sorted_by_priority_moneyboxes=updated_moneyboxes,
-                            distribute_amount=overflow_moneybox_amount,
-                        )
-                    else:
-                        raise ValueError(f"Unknown action: {action}")
-
-                    _ = await self._distribute_automated_savings_amount(
+                post_distributed_moneyboxes: list[dict[str, Any]] = (
+                    await self._distribute_automated_savings_amount(
                         session=session,
                         sorted_by_priority_moneyboxes=updated_moneyboxes,
                         distribution_amounts=distribution_amounts,
                         distribution_description=transaction_description,
                     )
+                )
+                latest_moneyboxes |= {
+                    moneybox["id"]: moneybox
+                    for moneybox in post_distributed_moneyboxes
+                    if distribution_amounts.get(moneybox["id"], 0) > 0
+                }
 
-                    last_overflow_moneybox_amount = overflow_moneybox_amount
-
-            # log automated saving
-            automated_savings_log_data: dict[str, Any] = {
-                "action": ActionType.APPLIED_AUTOMATED_SAVING,
-                "action_at": datetime.now(tz=timezone.utc),
-                "details": jsonable_encoder(
-                    app_settings.asdict()
-                    | {
-                        "distribution_amount": distribution_amount,
-                    }
-                ),
-            }
+                last_overflow_moneybox_amount = overflow_moneybox_amount
 
-            await self.db_manager.add_action_log(
-                session=session,
-                automated_savings_log_data=automated_savings_log_data,
-            )
+        final_moneyboxes: list[dict[str, Any]] = sorted(
+            latest_moneyboxes.values(),
+            key=lambda item: item["priority"],
+        )
 
-        return True
+        # log automated saving
+        automated_savings_log_data: dict[str, Any] = {
+            "action": ActionType.APPLIED_AUTOMATED_SAVING,
+            "action_at": action_at if action_at is not None else datetime.now(tz=timezone.utc),
+            "details": jsonable_encoder(
+                app_settings.asdict()
+                | {
+                    "distribution_amount": distribution_amount,
+                    # snapshot for the report, so no db reads are needed while sending
+                    "moneyboxes": [
+                        {
+                            "name": moneybox["name"],
+                            "balance": moneybox["balance"],
+                            "priority": moneybox["priority"],
+                        }
+                        for moneybox in final_moneyboxes
+                    ],
+                }
+                | ({"catch_up": True} if action_at is not None else {})
+            ),
+        }
+
+        await self.db_manager.add_action_log(
+            session=session,
+            automated_savings_log_data=automated_savings_log_data,
+        )
+
+        return final_moneyboxes
 
     async def _distribute_automated_savings_amount(  # noqa: ignore  # pylint:disable=too-many-locals, too-many-arguments, too-many-positional-arguments
         self,
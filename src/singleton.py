@@ -1,7 +1,16 @@
-"""Everything about the limiter is implemented here."""
+"""Everything about the limiters and the task registry is implemented here."""
 
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 
+from src.auth.login_throttle import LoginThrottle
+from src.task_registry import TaskRegistry
+
 limiter: Limiter = Limiter(key_func=get_remote_address)
 """The global limiter for all fastAPI endpoints."""
+
+login_throttle: LoginThrottle = LoginThrottle()
+"""The global throttle for failed logins per user name and client IP."""
+
+task_registry: TaskRegistry = TaskRegistry()
+"""The global registry of all background task executions."""
@@ -0,0 +1,155 @@
+"""The in-process registry of background task executions is located here."""
+
+import time
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from sqlalchemy import Engine, event
+
+from src.custom_types import TaskOutcomeType
+
+_rows_touched: ContextVar[list[int] | None] = ContextVar("rows_touched", default=None)
+"""The counter of inserted/updated/deleted rows of the current task execution."""
+
+
+@dataclass
+class TaskRunStats:
+    """The execution stats of a background task."""
+
+    task_name: str
+    """The name of the task."""
+
+    run_count: int = 0
+    """The number of executions."""
+
+    success_count: int = 0
+    """The number of successful executions."""
+
+    failure_count: int = 0
+    """The number of failed executions."""
+
+    last_outcome: TaskOutcomeType | None = None
+    """The outcome of the last execution, None if never executed."""
+
+    last_started_at: datetime | None = None
+    """The start datetime of the last execution."""
+
+    last_finished_at: datetime | None = None
+    """The end datetime of the last execution."""
+
+    last_duration: float | None = None
+    """The duration of the last execution in seconds."""
+
+    last_rows_touched: int | None = None
+    """The number of inserted/updated/deleted rows of the last execution."""
+
+    total_rows_touched: int = 0
+    """The number of inserted/updated/deleted rows of all executions."""
+
+    last_exception: str | None = None
+    """The exception of the last failed execution."""
+
+    next_run_at: datetime | None = None
+    """The datetime of the next scheduled execution."""
+
+
+class TaskRegistry:
+    """The TaskRegistry collects the execution stats of all background tasks.
+
+    Rows touched are counted by an sqlalchemy cursor event, which has to be installed
+    once per engine by :meth:`instrument_engine`.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the TaskRegistry instance."""
+
+        self.tasks: dict[str, TaskRunStats] = {}
+
+    def instrument_engine(self, engine: Engine) -> None:
+        """Install the rows touched counter on the given (sync) engine.
+
+        :param engine: The sync engine, for async engines: `async_engine.sync_engine`.
+        :type engine: :class:`Engine`
+        """
+
+        if not event.contains(engine, "after_cursor_execute", _count_rows_touched):
+            event.listen(engine, "after_cursor_execute", _count_rows_touched)
+
+    @asynccontextmanager
+    async def track(self, task_name: str, interval: float) -> AsyncGenerator[TaskRunStats, None]:
+        """Track one execution of the task with the given name.
+
+        Exceptions are recorded in the task stats and re-raised.
+
+        :param task_name: The name of the task.
+        :type task_name: :class:`str`
+        :param interval: Seconds until the next execution.
+        :type interval: :class:`float`
+        :return: The stats of the task as async context manager.
+        :rtype: :class:`AsyncGenerator[TaskRunStats, None]`
+        """
+
+        task_stats: TaskRunStats = self.tasks.setdefault(
+            task_name,
+            TaskRunStats(task_name=task_name),
+        )
+        task_stats.run_count += 1
+        task_stats.last_outcome = TaskOutcomeType.RUNNING
+        task_stats.last_started_at = datetime.now(tz=timezone.utc)
+        task_stats.next_run_at = None
+
+        rows_touched: list[int] = [0]
+        token = _rows_touched.set(rows_touched)
+        started_at: float = time.perf_counter()
+
+        try:
+            yield task_stats
+        except Exception as ex:
+            task_stats.failure_count += 1
+            task_stats.last_outcome = TaskOutcomeType.FAILURE
+            task_stats.last_exception = repr(ex)
+            raise
+        else:
+            task_stats.success_count += 1
+            task_stats.last_outcome = TaskOutcomeType.SUCCESS
+        finally:
+            _rows_touched.reset(token)
+
+            task_stats.last_duration = time.perf_counter() - started_at
+            task_stats.last_finished_at = datetime.now(tz=timezone.utc)
+            task_stats.last_rows_touched = rows_touched[0]
+            task_stats.total_rows_touched += rows_touched[0]
+            task_stats.next_run_at = task_stats.last_finished_at + timedelta(seconds=interval)
+
+    def status(self) -> list[dict[str, Any]]:
+        """Get the execution stats of all tracked tasks.
+
+        :return: The task stats sorted by task name.
+        :rtype: :class:`list[dict[str, Any]]`
+        """
+
+        return [asdict(self.tasks[task_name]) for task_name in sorted(self.tasks)]
+
+
+def _count_rows_touched(  # pylint: disable=too-many-arguments, too-many-positional-arguments
+    conn: Any,  # pylint: disable=unused-argument
+    cursor: Any,
+    statement: str,  # pylint: disable=unused-argument
+    parameters: Any,  # pylint: disable=unused-argument
+    context: Any,
+    executemany: bool,  # pylint: disable=unused-argument
+) -> None:
+    """Sqlalchemy `after_cursor_execute` event, adds the affected rows of DML statements
+    to the rows touched counter of the current task execution."""
+
+    rows_touched: list[int] | None = _rows_touched.get()
+
+    if rows_touched is None or context is None:
+        return
+
+    if (context.isinsert or context.isupdate or context.isdelete) and cursor.rowcount > 0:
+        rows_touched[0] += cursor.rowcount
@@ -2,7 +2,7 @@
 
 import asyncio
 import inspect
-from datetime import date, datetime
+from datetime import datetime, timedelta, timezone
 from typing import Any, Callable
 
 from src.custom_types import ActionType
@@ -13,6 +13,15 @@ from src.report_sender.email_sender.sender import EmailSender
 from src.savings_distribution.automated_savings_distribution import (
     AutomatedSavingsDistributionService,
 )
+from src.singleton import task_registry
+from src.utils import exponential_backoff
+
+REPORT_RETRY_BASE_DELAY: float = 60 * 60
+"""Seconds until a failed report is sent again after the first failure (doubles each
+failure)."""
+
+REPORT_RETRY_MAX_DELAY: float = 24 * 60 * 60
+"""The max seconds until a failed report is sent again."""
 
 
 class BackgroundTaskRunner:
@@ -25,6 +34,9 @@ class BackgroundTaskRunner:
 
     Each task_ method has to implement its own endless loop and sleep (->self.sleep_time)
     (if an endless task is wanted) and its own date trigger.
+
+    Executions of tasks decorated with :class:`every` are tracked (timing, outcome,
+    exception, rows touched, next run) in the global task registry.
     """
 
     def __init__(
@@ -46,6 +58,9 @@ class BackgroundTaskRunner:
         self.sleep_time: int = 60 * 60  # each hour
         self.background_tasks: set[asyncio.Task] = set()
 
+        # count the rows touched by each task execution
+        task_registry.instrument_engine(self.db_manager.async_engine.sync_engine)
+
     async def run(self) -> None:
         """Collect all async methods of the class that start with 'task_'"""
 
@@ -67,7 +82,11 @@ class BackgroundTaskRunner:
         'email_send_queue').
 
         If email was sent successfully, related db record will be removed
-        from db table.
+        from db table. All pending reports are sent as one batch over the pooled
+        smtp connections of the email sender.
+
+        A failed report is retried with exponential backoff (and jitter), its retry
+        state is stored in the details of the related action log.
         """
 
         current_method_name: str = inspect.currentframe().f_code.co_name.upper()  # type: ignore
@@ -77,9 +96,10 @@ class BackgroundTaskRunner:
             ActionType.APPLIED_AUTOMATED_SAVING,
         }
 
-        # Callback function to handle sending emails for different types of logs
-        send_email_callbacks = {
-            ActionType.APPLIED_AUTOMATED_SAVING: self.email_sender.send_email_automated_savings_done_successfully,  # noqa: E501 # pylint: disable=line-too-long
+        # Callback function to handle sending emails for different types of logs,
+        # all pending reports of one type will be sent as one batch
+        send_emails_callbacks = {
+            ActionType.APPLIED_AUTOMATED_SAVING: self.email_sender.send_emails_automated_savings_done_successfully,  # noqa: E501 # pylint: disable=line-too-long
         }
 
         app_settings: AppSettings = (
@@ -90,32 +110,54 @@ class BackgroundTaskRunner:
             receiver_email = app_settings.user_email_address
 
             for log_type in log_types_for_email_report:
-                _send_email = send_email_callbacks[log_type]
+                _send_emails = send_emails_callbacks[log_type]
                 action_logs: list[dict[str, Any]] = await self.db_manager.get_action_logs(
                     action_type=log_type,
                 )
+                now: datetime = datetime.now(tz=timezone.utc)
                 action_logs = [
-                    log for log in action_logs if not log["details"].get("report_sent", False)
+                    log
+                    for log in reversed(action_logs)
+                    if not log["details"].get("report_sent", False)
+                    and self.is_report_due(action_log=log, now=now)
                 ]
 
-                for action_log in reversed(action_logs):
-                    response = await _send_email(
-                        to=receiver_email,
-                        subject=(
-                            f"Automated savings done ({action_log['created_at']:%Y-%m-%d %H:%M})"
-                        ),
-                    )
+                responses: list[bool] = await _send_emails(
+                    to=receiver_email,
+                    reports=[
+                        (
+                            f"Automated savings done ({action_log['created_at']:%Y-%m-%d %H:%M})",
+                            action_log["details"].get("moneyboxes"),
+                        )
+                        for action_log in action_logs
+                    ],
+                )
+
+                sent_reports_count: int = 0
 
+                for action_log, response in zip(action_logs, responses):
                     if response:
                         await self.db_manager.update_action_log(
                             action_log_id=action_log["id"],
                             data={"details": action_log["details"] | {"report_sent": True}},
                         )
+                        sent_reports_count += 1
+                    else:
+                        await self.db_manager.update_action_log(
+                            action_log_id=action_log["id"],
+                            data={
+                                "details": action_log["details"]
+                                | self.next_report_retry_state(action_log=action_log, now=now)
+                            },
+                        )
 
                 if action_logs:
                     await self.print_task(
                         task_name=current_method_name,
-                        message=f"{len(action_logs)} reports sent successfully via email.",
+                        message=(
+                            f"{sent_reports_count}/{len(action_logs)} reports sent "
+                            "successfully via email."
+                        ),
                     )
                 else:
                     await self.print_task(task_name=current_method_name, message="Nothing to do.")
@@ -125,46 +167,164 @@ class BackgroundTaskRunner:
                 message="No emails sent, 'send_reports_via_email' in settings is disabled.",
             )
 
+    @staticmethod
+    def is_report_due(action_log: dict[str, Any], now: datetime) -> bool:
+        """Check, if the backoff delay of a failed report is over.
+
+        :param action_log: The action log of the report.
+        :type action_log: :class:`dict[str, Any]`
+        :param now: The current datetime.
+        :type now: :class:`datetime`
+        :return: True, if the report should be sent (again), False if not.
+        :rtype: :class:`bool`
+        """
+
+        next_attempt_at: str | None = action_log["details"].get("report_next_attempt_at")
+
+        return next_attempt_at is None or datetime.fromisoformat(next_attempt_at) <= now
+
+    @staticmethod
+    def next_report_retry_state(action_log: dict[str, Any], now: datetime) -> dict[str, Any]:
+        """Calculate the retry state of a failed report, the next attempt is
+        delayed by exponential backoff (with jitter).
+
+        :param action_log: The action log of the failed report.
+        :type action_log: :class:`dict[str, Any]`
+        :param now: The current datetime.
+        :type now: :class:`datetime`
+        :return: The retry state to merge into the action log details.
+        :rtype: :class:`dict[str, Any]`
+        """
+
+        attempts: int = action_log["details"].get("report_attempts", 0) + 1
+        delay: float = exponential_backoff(
+            attempt=attempts,
+            base_delay=REPORT_RETRY_BASE_DELAY,
+            max_delay=REPORT_RETRY_MAX_DELAY,
+        )
+
+        return {
+            "report_attempts": attempts,
+            "report_next_attempt_at": (now + timedelta(seconds=delay)).isoformat(),
+        }
+
     @every.hour(1)
     async def task_automated_savings(self) -> None:
         """This is the task for automated savings.
         Checks if distribution day is reached and does the task.
 
         - do task on each 1st of month
+        - catch up all missed months (e.g. after a server downtime) since the last
+          applied automated savings in one batch
         """
 
         current_method_name: str = inspect.currentframe().f_code.co_name.upper()  # type: ignore
         today_dt: datetime = datetime.today()
-        already_done: bool = False
 
-        if today_dt.day == 1 and today_dt.hour >= 12:
-            automated_action_logs: list[dict[str, Any]] = await self.db_manager.get_action_logs(
-                action_type=ActionType.APPLIED_AUTOMATED_SAVING,
+        automated_action_logs: list[dict[str, Any]] = await self.db_manager.get_action_logs(
+            action_type=ActionType.APPLIED_AUTOMATED_SAVING,
+        )
+        activation_action_logs: list[dict[str, Any]] = [
+            *await self.db_manager.get_action_logs(
+                action_type=ActionType.ACTIVATED_AUTOMATED_SAVING,
+            ),
+            *await self.db_manager.get_action_logs(
+                action_type=ActionType.DEACTIVATED_AUTOMATED_SAVING,
+            ),
+        ]
+
+        missed_dates: list[datetime] = self.get_missed_distribution_dates(
+            now=today_dt,
+            applied_dates=[log["action_at"] for log in automated_action_logs],
+            activation_changes=[(log["action_at"], log["action"]) for log in activation_action_logs],
+        )
+
+        if not missed_dates:
+            return
+
+        if missed_dates == [today_dt.replace(day=1, hour=12, minute=0, second=0, microsecond=0)]:
+            # regular run of the current month
+            result: bool = (
+                await self.automated_distribution_service.run_automated_savings_distribution()
             )
+            message: str = "Automated savings run."
+        else:
+            result = await self.automated_distribution_service.run_automated_savings_distribution(
+                action_dates=[missed_date.astimezone() for missed_date in missed_dates],
+            )
+            message = f"Automated savings run, caught up {len(missed_dates)} months."
 
-            if automated_action_logs:
-                automated_action_logs_dates: list[date] = [
-                    automated_action_log["action_at"].date()
-                    for automated_action_log in automated_action_logs
-                ]
+        if result:
+            await self.print_task(task_name=current_method_name, message=message)
+        else:
+            await self.print_task(
+                task_name=current_method_name,
+                message="Nothing to do. Automated savings is deactivated.",
+            )
 
-                if today_dt.date() in automated_action_logs_dates:
-                    already_done = True
+    @staticmethod
+    def get_missed_distribution_dates(
+        now: datetime,
+        applied_dates: list[datetime],
+        activation_changes: list[tuple[datetime, ActionType]],
+    ) -> list[datetime]:
+        """Get the dates of all due, but not applied, automated savings distributions.
+
+        A distribution is due on each 1st of month at 12:00. Without any applied
+        distribution, only the distribution of the current day is due. Months, in
+        which automated savings were deactivated on the due date, are skipped.
+
+        :param now: The current local datetime (naive).
+        :type now: :class:`datetime`
+        :param applied_dates: The dates of all applied distributions.
+        :type applied_dates: :class:`list[datetime]`
+        :param activation_changes: The dates and actions of all (de)activations of
+            automated savings.
+        :type activation_changes: :class:`list[tuple[datetime, ActionType]]`
+        :return: The missed distribution dates (local, naive) in chronological order.
+        :rtype: :class:`list[datetime]`
+        """
 
-            if not already_done:
-                result: bool = (
-                    await self.automated_distribution_service.run_automated_savings_distribution()
-                )
+        def _to_local(dt: datetime) -> datetime:
+            return dt.astimezone().replace(tzinfo=None) if dt.tzinfo is not None else dt
 
-                if result:
-                    await self.print_task(
-                        task_name=current_method_name, message="Automated savings run."
-                    )
-                else:
-                    await self.print_task(
-                        task_name=current_method_name,
-                        message="Nothing to do. Automated savings is deactivated.",
-                    )
+        local_applied_dates: list[datetime] = [_to_local(dt) for dt in applied_dates]
+        applied_months: set[tuple[int, int]] = {(dt.year, dt.month) for dt in local_applied_dates}
+        sorted_activation_changes: list[tuple[datetime, ActionType]] = sorted(
+            (_to_local(dt), action) for dt, action in activation_changes
+        )
+
+        # the first possible due date: the month after the last applied distribution
+        anchor_dt: datetime = (
+            max(local_applied_dates)
+            if local_applied_dates
+            else now.replace(hour=0, minute=0, second=0, microsecond=0)
+        )
+        due_dt: datetime = anchor_dt.replace(day=1, hour=12, minute=0, second=0, microsecond=0)
+        missed_dates: list[datetime] = []
+
+        while due_dt <= now:
+            last_activation_change: ActionType | None = None
+
+            for changed_at, action in sorted_activation_changes:
+                if changed_at > due_dt:
+                    break
+
+                last_activation_change = action
+
+            if (
+                due_dt > anchor_dt
+                and (due_dt.year, due_dt.month) not in applied_months
+                and last_activation_change is not ActionType.DEACTIVATED_AUTOMATED_SAVING
+            ):
+                missed_dates.append(due_dt)
+
+            due_dt = due_dt.replace(
+                year=due_dt.year + due_dt.month // 12,
+                month=due_dt.month % 12 + 1,
+            )
+
+        return missed_dates
 
     async def print_task(self, task_name: str, message: str) -> None:
         """The background task runner is responsible for printing out the task information."""
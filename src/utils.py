@@ -1,6 +1,7 @@
 """All helper functions are located here."""
 
 import os
+import random
 import tomllib
 from functools import cache
 from pathlib import Path
@@ -9,6 +10,9 @@ from typing import Any, Sequence
 import tabulate
 from dictalchemy import asdict
 from pydantic.alias_generators import to_camel
+from starlette import status
+from starlette.requests import Request
+from starlette.responses import Response
 
 from src.constants import ENVIRONMENT_ENV_FILE_PATHS
 from src.custom_types import (
@@ -153,28 +157,101 @@ def as_dict(  # type: ignore  # noqa: ignore  # pylint: disable=missing-function
     )
 
 
-def tabulate_str(headers: Sequence, rows: Sequence, show_index: bool = False) -> str:
+def tabulate_str(
+    headers: Sequence,
+    rows: Sequence,
+    show_index: bool = False,
+    min_padding: int = 35,
+) -> str:
     """Helper function to get an ascii table based on headers and rows.
 
+    The min padding is applied by padding the headers, so the global
+    `tabulate.MIN_PADDING` stays untouched.
+
     :param headers: The headers of the table.
     :type headers: :class:`Sequence`
     :param rows: The row data of the table.
     :type rows: :class:`Sequence`
     :param show_index: Flag to show indexes in table.
     :type show_index: :class:`bool`
+    :param min_padding: The min padding of each column, defaults to 35.
+    :type min_padding: :class:`int`
     :return: The generated string table.
     :rtype: :class:`str`
     """
 
-    tabulate.MIN_PADDING = 35
+    extra_padding: int = max(min_padding - tabulate.MIN_PADDING, 0)
+    padded_headers: list[str] = [
+        str(header).ljust(len(str(header)) + extra_padding) for header in headers
+    ]
+
+    if show_index:
+        padded_headers.insert(0, " " * extra_padding)
+
     return tabulate.tabulate(
-        headers=headers,
+        headers=padded_headers,
         tabular_data=rows,
         tablefmt="plain",
         showindex=show_index,
     )
 
 
+def exponential_backoff(attempt: int, base_delay: float, max_delay: float) -> float:
+    """Calculate the delay of a retry with exponential backoff and (equal) jitter.
+
+    :param attempt: The number of failed attempts, starting with 1.
+    :type attempt: :class:`int`
+    :param base_delay: The delay after the first failed attempt.
+    :type base_delay: :class:`float`
+    :param max_delay: The upper bound of the delay.
+    :type max_delay: :class:`float`
+    :return: The delay, between the half and the full exponential delay.
+    :rtype: :class:`float`
+    """
+
+    delay: float = min(max_delay, base_delay * 2 ** max(attempt - 1, 0))
+    return delay / 2 + random.uniform(0, delay / 2)
+
+
+def check_data_version_etag(
+    request: Request,
+    response: Response,
+    data_version: int,
+) -> Response | None:
+    """Set the ETag of the given data version to the response and check it against
+    the `If-None-Match` header of the request.
+
+    The ETag includes the app version, because the response format may change
+    with an app update, even if the data did not.
+
+    :param request: The current request.
+    :type request: :class:`Request`
+    :param response: The (injected) response of the endpoint.
+    :type response: :class:`Response`
+    :param data_version: The current data version.
+    :type data_version: :class:`int`
+    :return: A `304 Not Modified` response, if the client has the current version,
+        otherwise None.
+    :rtype: :class:`Response` | :class:`None`
+    """
+
+    etag: str = f'"{get_app_data()['version']}-{data_version}"'
+    headers: dict[str, str] = {"ETag": etag, "Cache-Control": "no-cache"}
+
+    if_none_match: str | None = request.headers.get("If-None-Match")
+
+    if if_none_match is not None:
+        client_etags: set[str] = {
+            client_etag.strip().removeprefix("W/") for client_etag in if_none_match.split(",")
+        }
+
+        if etag in client_etags or "*" in client_etags:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    response.headers.update(headers)
+    return None
+
+
 async def extract_database_violation_error(error_message: str) -> DBViolationErrorType:
     """Extracts the database violation error from the given error message.
 
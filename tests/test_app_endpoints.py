@@ -7,7 +7,10 @@ from httpx import AsyncClient
 from starlette import status
 
 from alembic.config import CommandLine
-from src.custom_types import EndpointRouteType
+from src.auth.login_throttle import LoginThrottle
+from src.custom_types import EndpointRouteType, TaskOutcomeType
+from src.db.db_manager import DBManager
+from src.singleton import task_registry
 from src.utils import equal_dict
 
 
@@ -223,3 +226,77 @@ async def test_app_login_fail(
         json=login_post_data,
     )
     assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.order(after="test_app_login_fail")
+async def test_app_login_fail__throttled(
+    client: AsyncClient,
+    db_manager: DBManager,
+) -> None:
+    login_post_data = {
+        "userName": "not-hannelore",
+        "userPassword": "sicher-ist-nichts",
+    }
+
+    with (
+        patch(
+            "src.routes.app.login_throttle",
+            LoginThrottle(user_name_capacity=2, user_name_refill_interval=60),
+        ),
+        patch.object(
+            db_manager,
+            "get_user_by_credentials",
+            wraps=db_manager.get_user_by_credentials,
+        ) as mock_get_user_by_credentials,
+    ):
+        for _ in range(2):
+            response = await client.post(
+                f"/{EndpointRouteType.APP_ROOT}/{EndpointRouteType.APP}/login",
+                json=login_post_data,
+            )
+            assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+        response = await client.post(
+            f"/{EndpointRouteType.APP_ROOT}/{EndpointRouteType.APP}/login",
+            json=login_post_data,
+        )
+
+    assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+    assert 0 < int(response.headers["Retry-After"]) <= 60
+    assert mock_get_user_by_credentials.call_count == 2
+
+    content = response.json()
+    assert content["message"] == "Too many failed logins. Try again later."
+    assert content["details"]["user_name"] == "not-hannelore"
+
+
+async def test_app_tasks_as_admin__success(admin_role_authed_client: AsyncClient) -> None:
+    async with task_registry.track(task_name="TASK_TEST", interval=60):
+        pass
+
+    response = await admin_role_authed_client.get(
+        f"/{EndpointRouteType.APP_ROOT}/{EndpointRouteType.APP}/tasks",
+    )
+    assert response.status_code == status.HTTP_200_OK
+
+    content = response.json()
+    assert content["total"] == len(content["tasks"])
+
+    task_stats = next(task for task in content["tasks"] if task["taskName"] == "TASK_TEST")
+    assert task_stats["lastOutcome"] == TaskOutcomeType.SUCCESS
+    assert task_stats["runCount"] >= 1
+    assert task_stats["nextRunAt"] is not None
+
+
+async def test_app_tasks_as_user__fail__403(user_role_authed_client: AsyncClient) -> None:
+    response = await user_role_authed_client.get(
+        f"/{EndpointRouteType.APP_ROOT}/{EndpointRouteType.APP}/tasks",
+    )
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+async def test_app_tasks_fail__401(client: AsyncClient) -> None:
+    response = await client.get(
+        f"/{EndpointRouteType.APP_ROOT}/{EndpointRouteType.APP}/tasks",
+    )
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
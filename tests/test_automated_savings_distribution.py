@@ -1,10 +1,11 @@
 """All automated_savings_distribution test are located here."""
 
+from datetime import datetime, timezone
 from typing import Any
 
 import pytest
 
-from src.custom_types import OverflowMoneyboxAutomatedSavingsModeType
+from src.custom_types import ActionType, OverflowMoneyboxAutomatedSavingsModeType
 from src.db.models import AppSettings
 from src.savings_distribution.automated_savings_distribution import (
     AutomatedSavingsDistributionService,
@@ -49,6 +50,55 @@ async def test_automated_savings_overflow_moneybox_mode_collect(
     # <<<
 
 
+@pytest.mark.asyncio
+async def test_automated_savings_catch_up_missed_months(
+    load_test_data: None,  # pylint: disable=unused-argument
+    automated_distribution_service: AutomatedSavingsDistributionService,
+) -> None:
+    action_dates = [
+        datetime(2024, 3, 1, 12, tzinfo=timezone.utc),
+        datetime(2024, 1, 1, 12, tzinfo=timezone.utc),
+        datetime(2024, 2, 1, 12, tzinfo=timezone.utc),
+    ]
+    await automated_distribution_service.run_automated_savings_distribution(
+        action_dates=action_dates,
+    )
+
+    moneyboxes = await automated_distribution_service.db_manager.get_moneyboxes()
+    expected_data = {
+        "Overflow Moneybox": 345,
+        "Test Box 1": 5,
+        "Test Box 2": 5,
+        "Test Box 3": 45,
+        "Test Box 4": 50,
+        "Test Box 5": 0,
+        "Test Box 6": 0,
+    }
+
+    for moneybox in moneyboxes:
+        assert moneybox["balance"] == expected_data[moneybox["name"]]
+
+    # one action log per month, applied in chronological order
+    action_logs = await automated_distribution_service.db_manager.get_action_logs(
+        action_type=ActionType.APPLIED_AUTOMATED_SAVING,
+    )
+    assert [action_log["action_at"] for action_log in action_logs] == sorted(
+        action_dates,
+        reverse=True,
+    )
+    assert all(action_log["details"]["catch_up"] for action_log in action_logs)
+
+    overflow_moneybox_balances = [
+        next(
+            moneybox["balance"]
+            for moneybox in action_log["details"]["moneyboxes"]
+            if moneybox["name"] == "Overflow Moneybox"
+        )
+        for action_log in reversed(action_logs)
+    ]
+    assert overflow_moneybox_balances == [105, 220, 345]
+
+
 @pytest.mark.asyncio
 async def test_automated_savings_overflow_moneybox_mode_add_to_amount(
     load_test_data: None,  # pylint: disable=unused-argument
@@ -108,6 +158,15 @@ async def test_automated_savings_overflow_moneybox_mode_fill_up(
     for moneybox in moneyboxes:
         assert moneybox["balance"] == expected_data[moneybox["name"]]
 
+    # the action log holds the moneyboxes snapshot for the report
+    action_logs = await automated_distribution_service.db_manager.get_action_logs(
+        action_type=ActionType.APPLIED_AUTOMATED_SAVING,
+    )
+    moneyboxes_snapshot = action_logs[0]["details"]["moneyboxes"]
+    assert {moneybox["name"]: moneybox["balance"] for moneybox in moneyboxes_snapshot} == (
+        expected_data
+    )
+
     # >>> test case for bug: issue #71
     # - test if correct overflow moneybox mode is set in transaction log of overflow moneybox
     overflow_moneybox = (
@@ -150,6 +209,15 @@ async def test_automated_savings_overflow_moneybox_mode_ratio(
     for moneybox in moneyboxes:
         assert moneybox["balance"] == expected_data[moneybox["name"]]
 
+    # the action log holds the moneyboxes snapshot for the report
+    action_logs = await automated_distribution_service.db_manager.get_action_logs(
+        action_type=ActionType.APPLIED_AUTOMATED_SAVING,
+    )
+    moneyboxes_snapshot = action_logs[0]["details"]["moneyboxes"]
+    assert {moneybox["name"]: moneybox["balance"] for moneybox in moneyboxes_snapshot} == (
+        expected_data
+    )
+
     overflow_moneybox = (
         await automated_distribution_service.db_manager._get_overflow_moneybox()  # noqa: typing  # pylint:disable=protected-access
     )
@@ -1800,6 +1800,33 @@ async def test_get_user_by_credentials_success(
     assert user is not None
 
 
+@pytest.mark.asyncio
+async def test_get_user_by_credentials__unknown_user_name_cached(
+    db_manager: DBManager,
+) -> None:
+    user_data: dict[str, str] = {
+        "user_name": "not-yet-existing@buxtehu.de",
+        "user_password": "sicher-ist-nichts",
+    }
+    user: dict[str, Any] | None = await db_manager.get_user_by_credentials(**user_data)
+    assert user is None
+
+    # second login with unknown user name is answered without database lookup
+    with patch.object(db_manager, "async_sessionmaker") as mock_async_sessionmaker:
+        user = await db_manager.get_user_by_credentials(**user_data)
+
+    assert user is None
+    mock_async_sessionmaker.assert_not_called()
+
+    # adding the user invalidates the cached user name
+    new_user: dict[str, Any] = await db_manager.add_user(**user_data)
+    user = await db_manager.get_user_by_credentials(**user_data)
+    assert user is not None
+    assert user["id"] == new_user["id"]
+
+    await db_manager.delete_user(user_id=new_user["id"])
+
+
 @pytest.mark.dependency(depends=["test_get_user_by_credentials_success"])
 @pytest.mark.asyncio
 async def test_update_user_name(
@@ -0,0 +1,253 @@
+"""All tests for the email sender and its smtp connection pool are located here."""
+
+import asyncio
+from email.message import EmailMessage
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+from aiosmtplib import SMTPServerDisconnected
+
+from src.custom_types import CircuitBreakerStateType
+
+from src.report_sender.email_sender.circuit_breaker import CircuitBreaker
+from src.report_sender.email_sender.sender import EmailSender
+from src.report_sender.email_sender.smtp_pool import SMTPConnectionPool
+
+
+class FakeSMTP:
+    """Fake smtp client, which counts connects and sent messages."""
+
+    connects: int = 0
+    fail_next_send: bool = False
+    active_sessions: int = 0
+    max_active_sessions: int = 0
+
+    def __init__(self) -> None:
+        self.is_connected = False
+        self.sent_messages: list[EmailMessage] = []
+
+    async def connect(self) -> None:
+        FakeSMTP.connects += 1
+        FakeSMTP.active_sessions += 1
+        FakeSMTP.max_active_sessions = max(
+            FakeSMTP.max_active_sessions,
+            FakeSMTP.active_sessions,
+        )
+        self.is_connected = True
+
+    async def send_message(
+        self, message: EmailMessage, **kwargs: Any  # pylint: disable=unused-argument
+    ) -> tuple[dict, str]:
+        if FakeSMTP.fail_next_send:
+            FakeSMTP.fail_next_send = False
+            raise SMTPServerDisconnected("Server disconnected.")
+
+        await asyncio.sleep(0)
+        self.sent_messages.append(message)
+        return {}, "Requested mail action okay, completed: id=42"
+
+    async def quit(self) -> None:
+        FakeSMTP.active_sessions -= 1
+        self.is_connected = False
+
+    def close(self) -> None:
+        self.is_connected = False
+
+
+def reset_fake_smtp() -> None:
+    FakeSMTP.connects = 0
+    FakeSMTP.fail_next_send = False
+    FakeSMTP.active_sessions = 0
+    FakeSMTP.max_active_sessions = 0
+
+
+async def test_smtp_pool_reuses_connection() -> None:
+    reset_fake_smtp()
+    smtp_pool = SMTPConnectionPool(client_factory=FakeSMTP, max_connections=2)
+
+    for _ in range(3):
+        async with smtp_pool.connection() as smtp_connection:
+            response = await smtp_connection.send_message(
+                EmailMessage(),
+                sender="sender@test.de",
+                recipients="receiver@test.de",
+            )
+            assert response == "Requested mail action okay, completed: id=42"
+
+    assert FakeSMTP.connects == 1
+
+    await smtp_pool.close()
+    assert FakeSMTP.active_sessions == 0
+
+
+async def test_smtp_pool_reconnects_on_failure() -> None:
+    reset_fake_smtp()
+    smtp_pool = SMTPConnectionPool(client_factory=FakeSMTP, max_connections=1)
+
+    async with smtp_pool.connection() as smtp_connection:
+        await smtp_connection.send_message(
+            EmailMessage(),
+            sender="sender@test.de",
+            recipients="receiver@test.de",
+        )
+        FakeSMTP.fail_next_send = True
+        response = await smtp_connection.send_message(
+            EmailMessage(),
+            sender="sender@test.de",
+            recipients="receiver@test.de",
+        )
+
+    assert response == "Requested mail action okay, completed: id=42"
+    assert FakeSMTP.connects == 2
+
+    await smtp_pool.close()
+
+
+async def test_smtp_pool_closes_idle_connection() -> None:
+    reset_fake_smtp()
+    smtp_pool = SMTPConnectionPool(client_factory=FakeSMTP, max_connections=1, idle_timeout=0)
+
+    for _ in range(2):
+        async with smtp_pool.connection() as smtp_connection:
+            await smtp_connection.send_message(
+                EmailMessage(),
+                sender="sender@test.de",
+                recipients="receiver@test.de",
+            )
+        await asyncio.sleep(0.01)
+
+    assert FakeSMTP.connects == 2
+    await smtp_pool.close()
+
+
+async def test_send_messages_bounded_concurrency(
+    email_sender: EmailSender,
+) -> None:
+    reset_fake_smtp()
+    smtp_pool = SMTPConnectionPool(client_factory=FakeSMTP, max_connections=2)
+
+    messages = [
+        {
+            "receiver": {"to": "receiver@test.de", "subj": f"Report {i}"},
+            "plain_message": "Report",
+        }
+        for i in range(10)
+    ]
+
+    with (
+        patch.object(email_sender, "smtp_pool", smtp_pool),
+        patch.object(email_sender.smtp_settings, "smtp_user_name", "sender@test.de"),
+    ):
+        responses = await email_sender._send_messages(  # pylint: disable=protected-access
+            messages=messages,
+        )
+
+        assert len(responses) == 10
+        assert all(response is not None for response in responses)
+        assert FakeSMTP.connects == 2
+        assert FakeSMTP.max_active_sessions == 2
+
+        await email_sender.close()
+        assert FakeSMTP.active_sessions == 0
+
+
+async def test_send_emails_automated_savings_done_from_snapshot(
+    email_sender: EmailSender,
+) -> None:
+    moneyboxes_snapshot = [
+        {"name": "Test Box 1", "balance": 1000, "priority": 1},
+        {"name": "Overflow Moneybox", "balance": 50, "priority": 0},
+    ]
+
+    with (
+        patch.object(email_sender.db_manager, "get_moneyboxes") as mock_get_moneyboxes,
+        patch.object(
+            email_sender,
+            "_send_message",
+            AsyncMock(return_value="Requested mail action okay, completed: id=42"),
+        ) as mock_send_message,
+        patch.object(
+            email_sender,
+            "_build_automated_savings_report",
+            wraps=email_sender._build_automated_savings_report,  # pylint: disable=protected-access
+        ) as mock_build_report,
+    ):
+        results = await email_sender.send_emails_automated_savings_done_successfully(
+            to="receiver@test.de",
+            reports=[
+                ("Automated savings done (1)", moneyboxes_snapshot),
+                ("Automated savings done (2)", moneyboxes_snapshot),
+            ],
+        )
+
+    assert results == [True, True]
+    mock_get_moneyboxes.assert_not_called()
+    mock_build_report.assert_called_once()
+
+    plain_message = mock_send_message.call_args.kwargs["plain_message"]
+    assert plain_message.index("Overflow Moneybox") < plain_message.index("Test Box 1")
+    assert "Total Balance: 10.50 €" in plain_message
+    assert "10.00 €" in mock_send_message.call_args.kwargs["html_message"]
+
+
+def test_circuit_breaker_opens_and_recovers() -> None:
+    circuit_breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=60)
+    assert circuit_breaker.state is CircuitBreakerStateType.CLOSED
+
+    for _ in range(2):
+        assert circuit_breaker.allow_request()
+        circuit_breaker.record_failure()
+
+    assert circuit_breaker.state is CircuitBreakerStateType.OPEN
+    assert not circuit_breaker.allow_request()
+    assert circuit_breaker.short_circuit_count == 1
+
+    # recovery timeout is over: only one trial request may pass
+    circuit_breaker.recovery_timeout = 0
+    assert circuit_breaker.state is CircuitBreakerStateType.HALF_OPEN
+    assert circuit_breaker.allow_request()
+    assert not circuit_breaker.allow_request()
+
+    circuit_breaker.record_failure()
+    assert circuit_breaker.opened_count == 2
+
+    assert circuit_breaker.allow_request()
+    circuit_breaker.record_success()
+
+    status = circuit_breaker.status()
+    assert status["state"] is CircuitBreakerStateType.CLOSED
+    assert status["consecutive_failures"] == 0
+    assert status["failure_count"] == 3
+    assert status["success_count"] == 1
+    assert status["short_circuit_count"] == 2
+    assert status["opened_at"] is None
+
+
+async def test_send_messages_short_circuits_unhealthy_smtp(
+    email_sender: EmailSender,
+) -> None:
+    circuit_breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=60)
+    messages = [
+        {
+            "receiver": {"to": "receiver@test.de", "subj": f"Report {i}"},
+            "plain_message": "Report",
+        }
+        for i in range(5)
+    ]
+
+    with (
+        patch.object(email_sender, "circuit_breaker", circuit_breaker),
+        patch.object(
+            email_sender,
+            "_send_message",
+            AsyncMock(side_effect=SMTPServerDisconnected("Server disconnected.")),
+        ) as mock_send_message,
+    ):
+        responses = await email_sender._send_messages(  # pylint: disable=protected-access
+            messages=messages,
+        )
+
+    assert responses == [None] * 5
+    assert mock_send_message.await_count == 2
+    assert circuit_breaker.state is CircuitBreakerStateType.OPEN
+    assert circuit_breaker.short_circuit_count == 3
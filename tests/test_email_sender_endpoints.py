@@ -5,7 +5,7 @@ from unittest.mock import patch
 from httpx import AsyncClient
 from starlette import status
 
-from src.custom_types import EndpointRouteType
+from src.custom_types import CircuitBreakerStateType, EndpointRouteType
 
 
 async def test_send_testemail_success(
@@ -26,3 +26,18 @@ async def test_send_testemail_success(
             f"/{EndpointRouteType.APP_ROOT}/{EndpointRouteType.EMAIL_SENDER}/send-testemail",
         )
         assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+
+
+async def test_get_email_status(
+    client: AsyncClient,
+) -> None:
+    response = await client.get(
+        f"/{EndpointRouteType.APP_ROOT}/{EndpointRouteType.EMAIL_SENDER}/status",
+    )
+    assert response.status_code == status.HTTP_200_OK
+
+    content = response.json()
+    assert content["state"] == CircuitBreakerStateType.CLOSED
+    assert content["failureThreshold"] == 3
+    assert content["shortCircuitCount"] == 0
+    assert content["openedAt"] is None
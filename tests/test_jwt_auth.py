@@ -0,0 +1,67 @@
+"""All tests for the JWT authentication are located here."""
+
+import time
+from unittest.mock import patch
+
+import jwt
+from httpx import AsyncClient
+from starlette import status
+
+from src.auth.jwt_auth import CachedAuthJWT, JWTClaimsCache
+from src.custom_types import EndpointRouteType
+
+
+def test_jwt_claims_cache_expiry_and_size() -> None:
+    claims_cache = JWTClaimsCache(max_size=2)
+    now = time.time()
+
+    claims_cache.set(key="expired", claims={"sub": "1", "exp": now - 1})
+    assert claims_cache.get(key="expired") is None
+    assert len(claims_cache) == 0
+
+    # claims without expiry are never cached
+    claims_cache.set(key="no_exp", claims={"sub": "1"})
+    assert claims_cache.get(key="no_exp") is None
+
+    claims_cache.set(key="token_1", claims={"sub": "1", "exp": now + 60})
+    claims_cache.set(key="token_2", claims={"sub": "2", "exp": now + 60})
+    assert claims_cache.get(key="token_1") == {"sub": "1", "exp": now + 60}
+
+    # token_2 is the least recently used one
+    claims_cache.set(key="token_3", claims={"sub": "3", "exp": now + 60})
+    assert claims_cache.get(key="token_2") is None
+    assert claims_cache.get(key="token_1") is not None
+    assert claims_cache.get(key="token_3") is not None
+
+
+def test_jwt_claims_cache_disabled() -> None:
+    claims_cache = JWTClaimsCache(max_size=0)
+    claims_cache.set(key="token_1", claims={"sub": "1", "exp": time.time() + 60})
+
+    assert claims_cache.get(key="token_1") is None
+
+
+async def test_jwt_claims_verified_once_per_token(
+    admin_role_authed_client: AsyncClient,
+) -> None:
+    CachedAuthJWT._claims_cache.clear()  # pylint: disable=protected-access
+
+    with patch("async_fastapi_jwt_auth.auth_jwt.jwt.decode", wraps=jwt.decode) as mock_decode:
+        for _ in range(3):
+            response = await admin_role_authed_client.get(
+                f"/{EndpointRouteType.APP_ROOT}/{EndpointRouteType.APP}/tasks",
+            )
+            assert response.status_code == status.HTTP_200_OK
+
+    assert mock_decode.call_count == 1
+
+
+async def test_jwt_claims_cached_role_check(
+    user_role_authed_client: AsyncClient,
+) -> None:
+    for _ in range(2):
+        response = await user_role_authed_client.get(
+            f"/{EndpointRouteType.APP_ROOT}/{EndpointRouteType.APP}/tasks",
+        )
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+        assert response.json()["message"] == "Not authorized. Missing role."
@@ -0,0 +1,76 @@
+"""All tests for the shared rate limiter storages are located here."""
+
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+from limits import parse
+from limits.strategies import FixedWindowRateLimiter
+from slowapi import Limiter
+from slowapi.util import get_remote_address
+
+from src.limiter_storage import SQLiteStorage, configure_limiter_storage
+
+
+def test_sqlite_storage_counts_and_expires(tmp_path: Path) -> None:
+    storage = SQLiteStorage(uri=f"sqlite:///{tmp_path / 'rate_limits.db'}")
+
+    with patch("src.limiter_storage.time.time", return_value=1000):
+        assert storage.incr(key="ip:1", expiry=60) == 1
+        assert storage.incr(key="ip:1", expiry=60, amount=2) == 3
+        assert storage.get(key="ip:1") == 3
+        assert storage.get_expiry(key="ip:1") == 1060
+        assert storage.get(key="ip:2") == 0
+
+    # window is over, the counter restarts
+    with patch("src.limiter_storage.time.time", return_value=1060):
+        assert storage.get(key="ip:1") == 0
+        assert storage.incr(key="ip:1", expiry=60) == 1
+        assert storage.get_expiry(key="ip:1") == 1120
+
+    storage.clear(key="ip:1")
+    assert storage.get(key="ip:1") == 0
+    assert storage.check()
+    storage.close()
+
+
+def test_sqlite_storage_shared_and_atomic(tmp_path: Path) -> None:
+    # one storage instance per worker process
+    uri = f"sqlite:///{tmp_path / 'rate_limits.db'}"
+    storages = [SQLiteStorage(uri=uri) for _ in range(4)]
+
+    def hit(storage: SQLiteStorage) -> None:
+        for _ in range(50):
+            storage.incr(key="ip:1", expiry=60)
+
+    threads = [threading.Thread(target=hit, args=(storage,)) for storage in storages]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    assert all(storage.get(key="ip:1") == 200 for storage in storages)
+    assert storages[0].reset() == 1
+
+    for storage in storages:
+        storage.close()
+
+
+def test_configure_limiter_storage(tmp_path: Path) -> None:
+    limiter = Limiter(key_func=get_remote_address)
+    configure_limiter_storage(
+        limiter=limiter,
+        storage_uri=f"sqlite:///{tmp_path / 'rate_limits.db'}",
+    )
+
+    assert isinstance(limiter._storage, SQLiteStorage)  # pylint: disable=protected-access
+    rate_limiter = limiter._limiter  # pylint: disable=protected-access
+    assert isinstance(rate_limiter, FixedWindowRateLimiter)
+
+    rate_limit = parse("2/minute")
+    assert rate_limiter.hit(rate_limit, "127.0.0.1")
+    assert rate_limiter.hit(rate_limit, "127.0.0.1")
+    assert not rate_limiter.hit(rate_limit, "127.0.0.1")
+    limiter._storage.close()  # pylint: disable=protected-access
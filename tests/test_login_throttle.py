@@ -0,0 +1,71 @@
+"""All tests for the login throttle are located here."""
+
+from unittest.mock import patch
+
+import pytest
+
+from src.auth.login_throttle import LoginThrottle
+
+
+def test_login_throttle_user_name_bucket() -> None:
+    login_throttle = LoginThrottle(user_name_capacity=3, user_name_refill_interval=10)
+
+    with patch("src.auth.login_throttle.time.monotonic", return_value=100):
+        for _ in range(3):
+            assert login_throttle.retry_after(user_name="hannelore", ip="10.0.0.1") == 0
+            login_throttle.record_failure(user_name="hannelore", ip="10.0.0.1")
+
+        assert login_throttle.retry_after(user_name="hannelore", ip="10.0.0.1") == 10
+        # other user names are not affected
+        assert login_throttle.retry_after(user_name="pythbuster", ip="10.0.0.1") == 0
+
+    # one token was refilled
+    with patch("src.auth.login_throttle.time.monotonic", return_value=110):
+        assert login_throttle.retry_after(user_name="hannelore", ip="10.0.0.2") == 0
+        login_throttle.record_failure(user_name="hannelore", ip="10.0.0.2")
+        assert login_throttle.retry_after(user_name="hannelore", ip="10.0.0.2") == 10
+
+    # bucket is full again and dropped
+    with patch("src.auth.login_throttle.time.monotonic", return_value=140):
+        assert login_throttle.retry_after(user_name="hannelore", ip="10.0.0.2") == 0
+        assert "user:hannelore" not in login_throttle._buckets  # pylint: disable=protected-access
+
+
+def test_login_throttle_ip_bucket() -> None:
+    login_throttle = LoginThrottle(ip_capacity=2, ip_refill_interval=5)
+
+    with patch("src.auth.login_throttle.time.monotonic", return_value=100):
+        login_throttle.record_failure(user_name="user_1", ip="10.0.0.1")
+        login_throttle.record_failure(user_name="user_2", ip="10.0.0.1")
+
+        # credential stuffing: different user names from one IP
+        assert login_throttle.retry_after(user_name="user_3", ip="10.0.0.1") == 5
+        assert login_throttle.retry_after(user_name="user_3", ip="10.0.0.2") == 0
+
+
+def test_login_throttle_success_resets_user_name_bucket() -> None:
+    login_throttle = LoginThrottle(user_name_capacity=2)
+
+    login_throttle.record_failure(user_name="hannelore", ip=None)
+    login_throttle.record_success(user_name="hannelore")
+    login_throttle.record_failure(user_name="hannelore", ip=None)
+
+    assert login_throttle.retry_after(user_name="hannelore", ip=None) == 0
+
+
+def test_login_throttle_max_entries() -> None:
+    login_throttle = LoginThrottle(max_entries=4)
+
+    for i in range(10):
+        login_throttle.record_failure(user_name=f"user_{i}", ip=f"10.0.0.{i}")
+
+    assert len(login_throttle._buckets) == 4  # pylint: disable=protected-access
+    assert "ip:10.0.0.9" in login_throttle._buckets  # pylint: disable=protected-access
+
+
+def test_login_throttle_invalid_config() -> None:
+    with pytest.raises(ValueError):
+        LoginThrottle(user_name_capacity=0)
+
+    with pytest.raises(ValueError):
+        LoginThrottle(ip_refill_interval=0)
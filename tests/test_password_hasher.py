@@ -0,0 +1,56 @@
+"""All tests for the password hasher are located here."""
+
+import asyncio
+import threading
+
+from src.auth.password_hasher import PasswordHasher
+
+
+async def test_password_hasher_hash_and_verify() -> None:
+    password_hasher = PasswordHasher(rounds=4, max_workers=1)
+
+    hashed_password = await password_hasher.hash(password="my-password")
+    assert hashed_password.startswith("$2b$04$")
+
+    assert await password_hasher.verify(
+        plain_password="my-password",
+        hashed_password=hashed_password,
+    )
+    assert not await password_hasher.verify(
+        plain_password=b"wrong-password",
+        hashed_password=hashed_password.encode(),
+    )
+
+    password_hasher.close()
+
+
+async def test_password_hasher_runs_in_thread_pool() -> None:
+    password_hasher = PasswordHasher(rounds=10, max_workers=2)
+    thread_names: list[str] = []
+    hashpw = password_hasher._hashpw  # pylint: disable=protected-access
+
+    def _hashpw(password: bytes) -> bytes:
+        thread_names.append(threading.current_thread().name)
+        return hashpw(password)
+
+    password_hasher._hashpw = _hashpw  # type: ignore  # pylint: disable=protected-access
+
+    ticks = 0
+
+    async def tick() -> None:
+        nonlocal ticks
+
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.001)
+
+    ticker = asyncio.create_task(tick())
+    await asyncio.gather(*(password_hasher.hash(password="my-password") for _ in range(4)))
+    ticker.cancel()
+
+    # the event loop kept running while hashing
+    assert ticks > 1
+    assert all(thread_name.startswith("bcrypt") for thread_name in thread_names)
+    assert len(set(thread_names)) <= 2
+
+    password_hasher.close()
@@ -0,0 +1,40 @@
+"""All tests for the task registry are located here."""
+
+import pytest
+
+from src.custom_types import TaskOutcomeType
+from src.task_registry import TaskRegistry
+
+
+async def test_task_registry_track_success() -> None:
+    task_registry = TaskRegistry()
+
+    async with task_registry.track(task_name="TASK_TEST", interval=60):
+        assert task_registry.tasks["TASK_TEST"].last_outcome is TaskOutcomeType.RUNNING
+
+    task_stats = task_registry.status()[0]
+    assert task_stats["task_name"] == "TASK_TEST"
+    assert task_stats["run_count"] == 1
+    assert task_stats["success_count"] == 1
+    assert task_stats["last_outcome"] is TaskOutcomeType.SUCCESS
+    assert task_stats["last_duration"] >= 0
+    assert task_stats["last_rows_touched"] == 0
+    assert (task_stats["next_run_at"] - task_stats["last_finished_at"]).total_seconds() == 60
+
+
+async def test_task_registry_track_failure() -> None:
+    task_registry = TaskRegistry()
+
+    with pytest.raises(ValueError):
+        async with task_registry.track(task_name="TASK_TEST", interval=60):
+            raise ValueError("Something went wrong.")
+
+    async with task_registry.track(task_name="TASK_TEST", interval=60):
+        pass
+
+    task_stats = task_registry.status()[0]
+    assert task_stats["run_count"] == 2
+    assert task_stats["success_count"] == 1
+    assert task_stats["failure_count"] == 1
+    assert task_stats["last_outcome"] is TaskOutcomeType.SUCCESS
+    assert task_stats["last_exception"] == "ValueError('Something went wrong.')"
@@ -1,14 +1,19 @@
 """All tests for the task runner are located here."""
 
 import asyncio
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any
 from unittest.mock import patch
 
-from src.custom_types import ActionType
+from src.custom_types import ActionType, TaskOutcomeType
 from src.db.db_manager import DBManager
 from src.report_sender.email_sender.sender import EmailSender
-from src.task_runner import BackgroundTaskRunner
+from src.singleton import task_registry
+from src.task_runner import (
+    REPORT_RETRY_BASE_DELAY,
+    REPORT_RETRY_MAX_DELAY,
+    BackgroundTaskRunner,
+)
 
 
 async def test_task_automated_savings_schedule(
@@ -400,6 +405,13 @@ async def test_task_email_sending__two_of_three(  # pylint: disable=too-many-loc
 
         assert mock_send.call_count == 2
 
+        task_stats = next(
+            task for task in task_registry.status() if task["task_name"] == "TASK_EMAIL_SENDING"
+        )
+        assert task_stats["last_outcome"] is TaskOutcomeType.SUCCESS
+        assert task_stats["last_rows_touched"] == 2
+        assert task_stats["next_run_at"] > task_stats["last_finished_at"]
+
         action_logs = await db_manager.get_action_logs(
             action_type=ActionType.APPLIED_AUTOMATED_SAVING,
         )
@@ -407,3 +419,73 @@ async def test_task_email_sending__two_of_three(  # pylint: disable=too-many-loc
         assert action_logs[0]["details"]["report_sent"]
         assert action_logs[1]["details"]["report_sent"]
         assert action_logs[2]["details"]["report_sent"]
+
+
+async def test_report_retry_with_backoff() -> None:
+    now = datetime.now(tz=timezone.utc)
+    action_log: dict[str, Any] = {"details": {}}
+    assert BackgroundTaskRunner.is_report_due(action_log=action_log, now=now)
+
+    delays = []
+
+    for _ in range(7):
+        action_log["details"] |= BackgroundTaskRunner.next_report_retry_state(
+            action_log=action_log,
+            now=now,
+        )
+        next_attempt_at = datetime.fromisoformat(action_log["details"]["report_next_attempt_at"])
+        delays.append((next_attempt_at - now).total_seconds())
+
+        assert not BackgroundTaskRunner.is_report_due(action_log=action_log, now=now)
+        assert BackgroundTaskRunner.is_report_due(action_log=action_log, now=next_attempt_at)
+
+    assert action_log["details"]["report_attempts"] == 7
+
+    # exponential delays with jitter: between the half and the full delay, capped
+    for attempt, delay in enumerate(delays, start=1):
+        max_delay = min(REPORT_RETRY_MAX_DELAY, REPORT_RETRY_BASE_DELAY * 2 ** (attempt - 1))
+        assert max_delay / 2 <= delay <= max_delay
+
+
+def test_get_missed_distribution_dates() -> None:
+    # without applied distributions, only the current 1st of month is due
+    assert BackgroundTaskRunner.get_missed_distribution_dates(
+        now=datetime(2024, 1, 1, 13),
+        applied_dates=[],
+        activation_changes=[],
+    ) == [datetime(2024, 1, 1, 12)]
+    assert not BackgroundTaskRunner.get_missed_distribution_dates(
+        now=datetime(2024, 1, 1, 11),
+        applied_dates=[],
+        activation_changes=[],
+    )
+    assert not BackgroundTaskRunner.get_missed_distribution_dates(
+        now=datetime(2024, 1, 2, 13),
+        applied_dates=[],
+        activation_changes=[],
+    )
+
+    # regular run, the current month is due
+    assert BackgroundTaskRunner.get_missed_distribution_dates(
+        now=datetime(2024, 2, 1, 12, 30),
+        applied_dates=[datetime(2024, 1, 1, 12, 5)],
+        activation_changes=[],
+    ) == [datetime(2024, 2, 1, 12)]
+    assert not BackgroundTaskRunner.get_missed_distribution_dates(
+        now=datetime(2024, 2, 1, 14),
+        applied_dates=[datetime(2024, 1, 1, 12, 5), datetime(2024, 2, 1, 12, 5)],
+        activation_changes=[],
+    )
+
+    # server was down for months, skip the month with deactivated automated savings
+    assert BackgroundTaskRunner.get_missed_distribution_dates(
+        now=datetime(2025, 1, 3, 8),
+        applied_dates=[datetime(2024, 9, 1, 12, 5)],
+        activation_changes=[
+            (datetime(2024, 10, 20), ActionType.DEACTIVATED_AUTOMATED_SAVING),
+            (datetime(2024, 12, 2), ActionType.ACTIVATED_AUTOMATED_SAVING),
+        ],
+    ) == [
+        datetime(2024, 10, 1, 12),
+        datetime(2025, 1, 1, 12),
+    ]
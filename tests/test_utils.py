@@ -3,12 +3,14 @@
 from typing import Any
 
 import pytest
+import tabulate
 
 from src.custom_types import AppEnvVariables
 from src.utils import (
     equal_dict,
     get_app_data,
     get_database_url,
+    tabulate_str,
 )
 
 
@@ -117,3 +119,18 @@ def test_equal_dict(
     expected_result: bool,
 ) -> None:
     assert equal_dict(dict_1, dict_2, exclude_keys) == expected_result
+
+
+def test_tabulate_str() -> None:
+    min_padding = tabulate.MIN_PADDING
+    table = tabulate_str(
+        headers=["MONEYBOX_NAME", "BALANCE"],
+        rows=[["Overflow Moneybox", "1.00 €"], ["Test Box 1", "10.00 €"]],
+    )
+
+    assert tabulate.MIN_PADDING == min_padding
+    assert table.splitlines() == [
+        "MONEYBOX_NAME                                     BALANCE",
+        "Overflow Moneybox                                 1.00 €",
+        "Test Box 1                                        10.00 €",
+    ]
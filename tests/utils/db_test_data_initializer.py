@@ -122,6 +122,7 @@ class DBTestDataInitializer:  # pylint: disable=too-many-public-methods
             ),
             "test_get_app_settings_invalid": self.truncate_tables,
             "test_automated_savings_overflow_moneybox_mode_collect": self.dataset_test_automated_savings_valid,
+            "test_automated_savings_catch_up_missed_months": self.dataset_test_automated_savings_valid,
             "test_automated_savings_overflow_moneybox_mode_add_to_amount": self.dataset_test_automated_savings_overflow_moneybox_mode_add_to_amount,
             "test_automated_savings_overflow_moneybox_mode_fill_up": self.dataset_test_automated_savings_overflow_moneybox_mode_fill_up,
             "test_automated_savings_overflow_moneybox_mode_ratio": self.dataset_test_automated_savings_overflow_moneybox_mode_ratio,